@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for Modern Data Visualization Dashboard
+Measures cold-start import time and memory of each entry point, and the
+statistics kernels on large frames
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Modules the apps import on start-up
+ENTRY_POINTS = ['visualizations', 'gradio_app', 'streamlit_app', 'demo']
+
+# Libraries that are only needed by some charts and are imported lazily
+HEAVY_LIBRARIES = ['matplotlib.pyplot', 'seaborn', 'wordcloud', 'folium', 'altair', 'plotly.figure_factory']
+
+# UI frameworks; each entry point should load at most its own
+FRAMEWORKS = ['streamlit', 'gradio']
+
+IMPORT_TIMER = """
+import json, resource, sys, time
+start = time.perf_counter()
+for name in {preload!r}:
+    __import__(name)
+__import__({module!r})
+seconds = time.perf_counter() - start
+# ru_maxrss is in KiB on Linux and bytes on macOS
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+print(json.dumps({{'seconds': seconds, 'rss': rss, 'frameworks': [f for f in {frameworks!r} if f in sys.modules]}}))
+"""
+
+
+def cold_import(module, preload=(), repeat=3):
+    """Median import time (seconds) and peak RSS (bytes) of module in fresh interpreters
+
+    ``preload`` modules are imported first inside the timed region, which
+    reproduces the cost of importing them eagerly. Also returns the UI
+    frameworks the import pulled in.
+    """
+    code = IMPORT_TIMER.format(module=module, preload=list(preload), frameworks=FRAMEWORKS)
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, text=True, check=True, env=env,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        runs.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return {
+        'seconds': statistics.median(run['seconds'] for run in runs),
+        'rss': statistics.median(run['rss'] for run in runs),
+        'frameworks': runs[-1]['frameworks']
+    }
+
+
+def benchmark_imports(entry_points=ENTRY_POINTS, repeat=3):
+    """Compare lazy imports against preloading every heavy library"""
+    print("🚀 Cold Import Time and Memory")
+    print("=" * 50)
+
+    for module in entry_points:
+        try:
+            lazy = cold_import(module, repeat=repeat)
+            eager = cold_import(module, preload=HEAVY_LIBRARIES, repeat=repeat)
+        except subprocess.CalledProcessError as e:
+            print(f"   • {module}: failed to import ({e.stderr.strip().splitlines()[-1]})")
+            continue
+        frameworks = ', '.join(lazy['frameworks']) or 'none'
+        print(f"   • {module} (frameworks: {frameworks})")
+        print(f"     - Import time: {lazy['seconds']:.3f}s lazy vs {eager['seconds']:.3f}s eager")
+        print(f"     - Peak RSS: {lazy['rss'] / 2**20:.0f} MB lazy vs {eager['rss'] / 2**20:.0f} MB eager")
+
+    print("-" * 50)
+
+
+def _legacy_statistics(data, column):
+    """DataProcessor.calculate_statistics before the fused kernel: one pandas pass per statistic"""
+    return {
+        'count': len(data),
+        'mean': data[column].mean(),
+        'median': data[column].median(),
+        'std': data[column].std(),
+        'min': data[column].min(),
+        'max': data[column].max(),
+        'q25': data[column].quantile(0.25),
+        'q75': data[column].quantile(0.75)
+    }
+
+
+def _best_time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def benchmark_statistics(rows=10_000_000, columns=4, repeat=3):
+    """Fused calculate_statistics against the per-statistic pandas version"""
+    from utils import data_processor
+
+    print(f"\n📊 Column Statistics ({rows:,} rows)")
+    print("=" * 50)
+
+    rng = np.random.default_rng(0)
+    names = [f'col_{i}' for i in range(columns)]
+    data = pd.DataFrame({name: rng.normal(100, 15, rows) for name in names})
+
+    legacy = _best_time(lambda: _legacy_statistics(data, names[0]), repeat)
+    fused = _best_time(lambda: data_processor.calculate_statistics(data, names[0]), repeat)
+    print(f"   • 1 column: {legacy:.3f}s legacy vs {fused:.3f}s fused ({legacy / fused:.1f}x)")
+
+    legacy = _best_time(lambda: [_legacy_statistics(data, name) for name in names], repeat)
+    fused = _best_time(lambda: data_processor.calculate_statistics(data, names), repeat)
+    print(f"   • {columns} columns: {legacy:.3f}s legacy vs {fused:.3f}s fused ({legacy / fused:.1f}x)")
+
+    print("-" * 50)
+
+
+def benchmark_figure_cache(charts=('Line Chart', 'Bar Chart', 'Pie Chart', 'Histogram', 'Violin Plot'), repeat=5):
+    """Figure cache hit against a rebuild (miss) for the demo charts"""
+    from visualizations import VisualizationGenerator
+
+    print("\n🖼️ Figure Cache")
+    print("=" * 50)
+
+    viz = VisualizationGenerator()
+    functions = viz.get_all_visualizations()
+    for name in charts:
+        create = functions[name]
+        create()
+
+        def miss():
+            viz.figure_cache.invalidate()
+            create()
+
+        miss_time = _best_time(miss, repeat)
+        create()
+        hit_time = _best_time(create, repeat)
+        print(f"   • {name}: {hit_time * 1000:.1f} ms hit vs {miss_time * 1000:.1f} ms miss ({miss_time / hit_time:.1f}x)")
+
+    print("-" * 50)
+
+
+def main():
+    benchmark_imports()
+    benchmark_statistics()
+    benchmark_figure_cache()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import sys
+import threading
+import weakref
+from collections import OrderedDict
+
+import pandas as pd
+
+
+def estimate_size(value):
+    """Estimate the in-memory size of a cached value in bytes"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        size = value.memory_usage(deep=True)
+        return int(size.sum()) if hasattr(size, 'sum') else int(size)
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items()
+        )
+    return sys.getsizeof(value)
+
+
+class LRUCache:
+    """Thread-safe LRU cache bounded by entry count and total size"""
+
+    def __init__(self, max_entries=64, max_bytes=None, sizeof=estimate_size):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """Return a cached value and mark it as recently used"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """Store a value, evicting least recently used entries as needed"""
+        size = self.sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Never let a single oversized value flush the whole cache
+                return value
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            self._evict()
+        return value
+
+    def get_or_create(self, key, factory):
+        """Return the cached value for key, building it with factory on a miss
+
+        The factory runs outside the lock so independent keys can be built
+        concurrently; racing builders of the same key must be deterministic.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+        return self.put(key, factory())
+
+    def invalidate(self, predicate=None):
+        """Drop all entries, or only those whose key matches predicate"""
+        with self._lock:
+            if predicate is None:
+                self._entries.clear()
+                self.total_bytes = 0
+                return
+            for key in [k for k in self._entries if predicate(k)]:
+                self.total_bytes -= self._entries.pop(key)[1]
+
+    def _evict(self):
+        while self._entries and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            _, (_, size) = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+
+    def stats(self):
+        """Return hit/miss counters and current occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+            }
+
+
+_fingerprints = {}
+
+
+def fingerprint(data):
+    """Content hash of a DataFrame, Series or JSON-serializable value
+
+    Hashes of pandas objects are memoized per object, so repeated lookups of
+    the same cached dataset do not rescan it.
+    """
+    if not isinstance(data, (pd.DataFrame, pd.Series)):
+        payload = json.dumps(data, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    memo = _fingerprints.get(id(data))
+    if memo is not None and memo[0]() is data:
+        return memo[1]
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(data.columns) if isinstance(data, pd.DataFrame) else data.name).encode())
+    digest.update(repr(list(data.dtypes) if isinstance(data, pd.DataFrame) else data.dtype).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    value = digest.hexdigest()
+
+    key = id(data)
+    _fingerprints[key] = (weakref.ref(data), value)
+    weakref.finalize(data, _fingerprints.pop, key, None)
+    return value
@@ -1,59 +1,199 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
-from wordcloud import WordCloud
-import json
+import zlib
+import functools
+import inspect
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cache import LRUCache
+from summaries import summarize_dataset
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - pyarrow ships with streamlit
+    pa = None
+
+# Bounds for the dataset cache; demo datasets are tiny, so the byte limit
+# only matters once generators are called with large sizes
+DATASET_CACHE_ENTRIES = 64
+DATASET_CACHE_BYTES = 256 * 1024 * 1024
+
+# Scale mode: largest dataset iter_dataset() will produce, and its default chunk size
+MAX_SCALE_ROWS = 10**8
+DEFAULT_CHUNK_ROWS = 1_000_000
+
+# Dataset names, as used by get_all_data() and the chart registry, and the
+# generator method behind each
+DATASETS = {
+    'time_series': 'generate_time_series_data',
+    'categorical': 'generate_categorical_data',
+    'scatter': 'generate_scatter_data',
+    'pie': 'generate_pie_data',
+    'heatmap': 'generate_heatmap_data',
+    '3d_scatter': 'generate_3d_scatter_data',
+    'area': 'generate_area_data',
+    'boxplot': 'generate_boxplot_data',
+    'histogram': 'generate_histogram_data',
+    'violin': 'generate_violin_data',
+    'wordcloud': 'generate_wordcloud_data',
+    'map': 'generate_map_data',
+    'gauge': 'generate_gauge_data',
+    'funnel': 'generate_funnel_data',
+    'radar': 'generate_radar_data'
+}
+
+
+def cached_dataset(func):
+    """Memoize a generator method on (generator name, parameters, seed)"""
+    signature = inspect.signature(func)
+
+    def cache_key(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        params = tuple((k, v) for k, v in bound.arguments.items() if k != 'self')
+        return (func.__name__, params, self.seed)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        key = cache_key(self, *args, **kwargs)
+        # Cached frames are shared between callers, so treat them as read-only
+        return self.cache.get_or_create(key, lambda: func(self, *args, **kwargs))
+
+    wrapper.cache_key = cache_key
+    return wrapper
+
+
+def to_ipc(data):
+    """Serialize a DataFrame to Arrow IPC stream bytes (other values pass through)"""
+    if pa is None or not isinstance(data, pd.DataFrame):
+        return data
+    table = pa.Table.from_pandas(data, preserve_index=True)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def from_ipc(payload):
+    """Inverse of to_ipc"""
+    if pa is None or not isinstance(payload, (pa.Buffer, bytes)):
+        return payload
+    return pa.ipc.open_stream(payload).read_all().to_pandas()
+
+
+def _generate_for_worker(seed, method, options):
+    """Process pool entry point: build one dataset and hand it back as Arrow IPC"""
+    return to_ipc(getattr(DataGenerator(seed), method)(**options))
+
+
+class LazyDatasets(Mapping):
+    """Read-only mapping of dataset names that generates each value on first access"""
+
+    def __init__(self, builders, values=None):
+        self._builders = builders
+        self._values = dict(values or {})
+
+    def __getitem__(self, name):
+        if name not in self._values:
+            self._values[name] = self._builders[name]()
+        return self._values[name]
+
+    def __iter__(self):
+        return iter(self._builders)
+
+    def __len__(self):
+        return len(self._builders)
+
+    def materialized(self):
+        """Names of the datasets generated so far"""
+        return list(self._values)
+
 
 class DataGenerator:
-    def __init__(self):
-        self.setup_random_seed()
+    def __init__(self, seed=42):
+        self.cache = LRUCache(max_entries=DATASET_CACHE_ENTRIES, max_bytes=DATASET_CACHE_BYTES)
+        self.setup_random_seed(seed)
         
     def setup_random_seed(self, seed=42):
-        """Set random seed for reproducible data"""
-        np.random.seed(seed)
-        random.seed(seed)
+        """Set the root seed that every generator's random stream is derived from"""
+        self.seed = seed
+    
+    def rng(self, stream, *spawn_key):
+        """Independent random generator for a named stream under the current seed
+
+        Streams never share state, so datasets are reproducible on their own
+        and can be generated concurrently in threads or processes.
+        """
+        key = (zlib.crc32(stream.encode()),) + tuple(spawn_key)
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=key))
+    
+    def refresh(self):
+        """Invalidate cached datasets and reseed so the next render gets fresh data"""
+        self.cache.invalidate()
+        self.setup_random_seed(self.seed + 1)
+    
+    def summarize(self, name):
+        """Statistics for a dataset (see summaries.summarize_dataset), cached with it
+
+        The summary is keyed on the dataset's own cache key, so it is built
+        at most once per dataset and is dropped with it on refresh.
+        """
+        method = getattr(self, DATASETS[name])
+        key = ('summary',) + method.cache_key(self)
+        return self.cache.get_or_create(key, lambda: summarize_dataset(method()))
     
+    def cache_stats(self):
+        """Get hit/miss counters for the dataset cache"""
+        return self.cache.stats()
+    
+    @cached_dataset
     def generate_time_series_data(self, days=365):
         """Generate time series data for line charts"""
+        rng = self.rng('time_series')
         dates = pd.date_range(start='2023-01-01', periods=days, freq='D')
         base_trend = np.linspace(100, 150, days)
         seasonal = 20 * np.sin(2 * np.pi * np.arange(days) / 365)
-        noise = np.random.normal(0, 5, days)
+        noise = rng.normal(0, 5, days)
         
         data = pd.DataFrame({
             'date': dates,
             'value': base_trend + seasonal + noise,
-            'volume': np.random.poisson(1000, days) + 500
+            'volume': rng.poisson(1000, days) + 500
         })
         return data
     
+    @cached_dataset
     def generate_categorical_data(self):
         """Generate categorical data for bar charts"""
+        rng = self.rng('categorical')
         categories = ['Technology', 'Healthcare', 'Finance', 'Education', 'Retail', 'Manufacturing', 'Transportation']
-        values = np.random.normal(100, 30, len(categories))
+        values = rng.normal(100, 30, len(categories))
         
         data = pd.DataFrame({
             'category': categories,
             'value': np.abs(values),
-            'growth': np.random.normal(5, 2, len(categories))
+            'growth': rng.normal(5, 2, len(categories))
         })
         return data
     
+    @cached_dataset
     def generate_scatter_data(self, n_points=500):
         """Generate scatter plot data with correlation"""
-        x = np.random.normal(0, 1, n_points)
-        y = 0.7 * x + np.random.normal(0, 0.3, n_points)
-        categories = np.random.choice(['A', 'B', 'C'], n_points)
+        rng = self.rng('scatter')
+        x = rng.normal(0, 1, n_points)
+        y = 0.7 * x + rng.normal(0, 0.3, n_points)
+        categories = rng.choice(['A', 'B', 'C'], n_points)
         
         data = pd.DataFrame({
             'x': x,
             'y': y,
             'category': categories,
-            'size': np.random.uniform(10, 100, n_points)
+            'size': rng.uniform(10, 100, n_points)
         })
         return data
     
+    @cached_dataset
     def generate_pie_data(self):
         """Generate data for pie charts"""
         categories = ['Desktop', 'Mobile', 'Tablet', 'Other']
@@ -66,83 +206,111 @@ class DataGenerator:
         })
         return data
     
+    @cached_dataset
     def generate_heatmap_data(self):
         """Generate correlation matrix data for heatmaps"""
-        np.random.seed(42)
+        rng = self.rng('heatmap')
         n_vars = 8
         variables = [f'Var_{i+1}' for i in range(n_vars)]
         
         # Generate correlation matrix
-        corr_matrix = np.random.uniform(-1, 1, (n_vars, n_vars))
+        corr_matrix = rng.uniform(-1, 1, (n_vars, n_vars))
         corr_matrix = (corr_matrix + corr_matrix.T) / 2  # Make symmetric
         np.fill_diagonal(corr_matrix, 1)  # Diagonal = 1
         
         data = pd.DataFrame(corr_matrix, columns=variables, index=variables)
         return data
     
+    @cached_dataset
     def generate_3d_scatter_data(self, n_points=200):
         """Generate 3D scatter plot data"""
-        x = np.random.normal(0, 1, n_points)
-        y = np.random.normal(0, 1, n_points)
-        z = 0.5 * x + 0.3 * y + np.random.normal(0, 0.5, n_points)
-        colors = np.random.choice(['red', 'blue', 'green'], n_points)
+        rng = self.rng('3d_scatter')
+        x = rng.normal(0, 1, n_points)
+        y = rng.normal(0, 1, n_points)
+        z = 0.5 * x + 0.3 * y + rng.normal(0, 0.5, n_points)
+        colors = rng.choice(['red', 'blue', 'green'], n_points)
         
         data = pd.DataFrame({
             'x': x,
             'y': y,
             'z': z,
             'color': colors,
-            'size': np.random.uniform(5, 20, n_points)
+            'size': rng.uniform(5, 20, n_points)
         })
         return data
     
+    @cached_dataset
     def generate_area_data(self, days=90):
         """Generate area chart data"""
+        rng = self.rng('area')
         dates = pd.date_range(start='2023-01-01', periods=days, freq='D')
         
         data = pd.DataFrame({
             'date': dates,
-            'revenue': np.cumsum(np.random.normal(1000, 200, days)),
-            'costs': np.cumsum(np.random.normal(600, 150, days)),
-            'profit': np.cumsum(np.random.normal(400, 100, days))
+            'revenue': np.cumsum(rng.normal(1000, 200, days)),
+            'costs': np.cumsum(rng.normal(600, 150, days)),
+            'profit': np.cumsum(rng.normal(400, 100, days))
         })
         return data
     
-    def generate_boxplot_data(self):
-        """Generate data for box plots"""
+    @cached_dataset
+    def generate_boxplot_data(self, n_samples=None):
+        """Generate data for box plots
+
+        ``n_samples`` fixes the number of rows per group; by default each
+        group gets a random size between 50 and 150.
+        """
+        rng = self.rng('boxplot')
         groups = ['Group A', 'Group B', 'Group C', 'Group D']
-        data_list = []
+        if n_samples is None:
+            sizes = rng.integers(50, 150, len(groups))
+        else:
+            sizes = np.full(len(groups), n_samples)
+        means = rng.uniform(50, 150, len(groups))
+        stds = rng.uniform(10, 30, len(groups))
         
-        for group in groups:
-            n_samples = np.random.randint(50, 150)
-            values = np.random.normal(np.random.uniform(50, 150), np.random.uniform(10, 30), n_samples)
-            data_list.extend([{'group': group, 'value': val} for val in values])
-        
-        return pd.DataFrame(data_list)
+        return self._grouped_normal_frame(rng, 'group', groups, np.repeat(np.arange(len(groups)), sizes), means, stds)
     
+    @cached_dataset
     def generate_histogram_data(self, n_samples=1000):
         """Generate histogram data"""
+        rng = self.rng('histogram')
         # Mix of normal distributions
-        data1 = np.random.normal(50, 10, n_samples // 2)
-        data2 = np.random.normal(80, 15, n_samples // 2)
+        data1 = rng.normal(50, 10, n_samples // 2)
+        data2 = rng.normal(80, 15, n_samples // 2)
         data = np.concatenate([data1, data2])
         
         return pd.DataFrame({'value': data})
     
-    def generate_violin_data(self):
-        """Generate violin plot data"""
+    @cached_dataset
+    def generate_violin_data(self, n_samples=None):
+        """Generate violin plot data
+
+        ``n_samples`` fixes the number of rows per category; by default each
+        category gets a random size between 100 and 300.
+        """
+        rng = self.rng('violin')
         categories = ['Category 1', 'Category 2', 'Category 3', 'Category 4']
-        data_list = []
+        if n_samples is None:
+            sizes = rng.integers(100, 300, len(categories))
+        else:
+            sizes = np.full(len(categories), n_samples)
+        means = 50 + np.arange(len(categories)) * 20
+        stds = 10 + np.arange(len(categories)) * 5
         
-        for i, category in enumerate(categories):
-            n_samples = np.random.randint(100, 300)
-            mean = 50 + i * 20
-            std = 10 + i * 5
-            values = np.random.normal(mean, std, n_samples)
-            data_list.extend([{'category': category, 'value': val} for val in values])
+        return self._grouped_normal_frame(rng, 'category', categories, np.repeat(np.arange(len(categories)), sizes), means, stds)
+    
+    def _grouped_normal_frame(self, rng, label, groups, codes, means, stds):
+        """Build a long-format frame of normal samples per group without per-row objects"""
+        codes = codes.astype(np.int8, copy=False)
+        values = rng.normal(np.asarray(means, dtype=float)[codes], np.asarray(stds, dtype=float)[codes])
         
-        return pd.DataFrame(data_list)
+        return pd.DataFrame({
+            label: pd.Categorical.from_codes(codes, categories=groups),
+            'value': values
+        })
     
+    @cached_dataset
     def generate_wordcloud_data(self):
         """Generate text data for word clouds"""
         words = {
@@ -153,8 +321,13 @@ class DataGenerator:
         }
         return words
     
-    def generate_map_data(self):
-        """Generate geographic data for maps"""
+    @cached_dataset
+    def generate_map_data(self, n_points=None):
+        """Generate geographic data for maps
+
+        With ``n_points`` the cities become cluster centres for that many
+        jittered locations, for exercising large-map rendering.
+        """
         cities = [
             {'city': 'New York', 'lat': 40.7128, 'lon': -74.0060, 'value': 100},
             {'city': 'London', 'lat': 51.5074, 'lon': -0.1278, 'value': 85},
@@ -165,8 +338,20 @@ class DataGenerator:
             {'city': 'Mumbai', 'lat': 19.0760, 'lon': 72.8777, 'value': 80},
             {'city': 'São Paulo', 'lat': -23.5505, 'lon': -46.6333, 'value': 65}
         ]
-        return pd.DataFrame(cities)
+        cities = pd.DataFrame(cities)
+        if n_points is None:
+            return cities
+        
+        rng = self.rng('map')
+        codes = rng.integers(0, len(cities), n_points)
+        return pd.DataFrame({
+            'city': pd.Categorical.from_codes(codes, categories=cities['city'].tolist()),
+            'lat': np.clip(cities['lat'].to_numpy()[codes] + rng.normal(0, 2, n_points), -85, 85),
+            'lon': (cities['lon'].to_numpy()[codes] + rng.normal(0, 2, n_points) + 180) % 360 - 180,
+            'value': np.clip(cities['value'].to_numpy()[codes] + rng.normal(0, 10, n_points), 1, None).round(1)
+        })
     
+    @cached_dataset
     def generate_gauge_data(self):
         """Generate data for gauge charts"""
         metrics = ['CPU Usage', 'Memory Usage', 'Disk Usage', 'Network Usage']
@@ -181,6 +366,7 @@ class DataGenerator:
         })
         return data
     
+    @cached_dataset
     def generate_funnel_data(self):
         """Generate funnel chart data"""
         stages = ['Website Visits', 'Product Views', 'Add to Cart', 'Checkout', 'Purchase']
@@ -193,6 +379,7 @@ class DataGenerator:
         })
         return data
     
+    @cached_dataset
     def generate_radar_data(self):
         """Generate radar chart data"""
         categories = ['Speed', 'Reliability', 'Usability', 'Features', 'Support', 'Price']
@@ -208,25 +395,174 @@ class DataGenerator:
         })
         return data
     
-    def get_all_data(self):
-        """Get all generated datasets"""
-        return {
-            'time_series': self.generate_time_series_data(),
-            'categorical': self.generate_categorical_data(),
-            'scatter': self.generate_scatter_data(),
-            'pie': self.generate_pie_data(),
-            'heatmap': self.generate_heatmap_data(),
-            '3d_scatter': self.generate_3d_scatter_data(),
-            'area': self.generate_area_data(),
-            'boxplot': self.generate_boxplot_data(),
-            'histogram': self.generate_histogram_data(),
-            'violin': self.generate_violin_data(),
-            'wordcloud': self.generate_wordcloud_data(),
-            'map': self.generate_map_data(),
-            'gauge': self.generate_gauge_data(),
-            'funnel': self.generate_funnel_data(),
-            'radar': self.generate_radar_data()
+    def iter_dataset(self, name, n_rows, chunk_size=DEFAULT_CHUNK_ROWS, **options):
+        """Yield a large synthetic dataset as DataFrame chunks of at most chunk_size rows
+
+        Only one chunk is alive at a time, so peak memory is bounded by
+        chunk_size regardless of n_rows. Chunks are not cached.
+        """
+        builders = {
+            'time_series': self._time_series_chunk,
+            'scatter': self._scatter_chunk,
+            '3d_scatter': self._3d_scatter_chunk,
+            'area': self._area_chunk,
+            'boxplot': self._boxplot_chunk,
+            'histogram': self._histogram_chunk,
+            'violin': self._violin_chunk
+        }
+        if name not in builders:
+            raise ValueError(f"Scale mode is not available for '{name}'; choose from {sorted(builders)}")
+        if not 0 < n_rows <= MAX_SCALE_ROWS:
+            raise ValueError(f"n_rows must be between 1 and {MAX_SCALE_ROWS:,}")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        
+        build = builders[name]
+        # Parameters shared by every chunk come from the stream's root; each
+        # chunk then draws from its own child stream
+        state = {'rng': self.rng(f'{name}:scale')}
+        for number, start in enumerate(range(0, n_rows, chunk_size)):
+            stop = min(start + chunk_size, n_rows)
+            yield build(self.rng(f'{name}:scale', number), np.arange(start, stop), n_rows, state, **options)
+    
+    def _time_series_chunk(self, rng, idx, total, state, freq='min'):
+        """Time series rows idx of total; minute resolution keeps 10^8 rows in range"""
+        if 'origin' not in state:
+            state['origin'] = pd.Timestamp('2023-01-01')
+            state['step'] = pd.tseries.frequencies.to_offset(freq)
+        start = state['origin'] + state['step'] * int(idx[0])
+        trend = 100 + 50 * idx / max(total - 1, 1)
+        seasonal = 20 * np.sin(2 * np.pi * idx / 365)
+        
+        return pd.DataFrame({
+            'date': pd.date_range(start=start, periods=len(idx), freq=state['step']),
+            'value': trend + seasonal + rng.normal(0, 5, len(idx)),
+            'volume': rng.poisson(1000, len(idx)) + 500
+        }, index=idx)
+    
+    def _scatter_chunk(self, rng, idx, total, state):
+        n = len(idx)
+        x = rng.normal(0, 1, n)
+        
+        return pd.DataFrame({
+            'x': x,
+            'y': 0.7 * x + rng.normal(0, 0.3, n),
+            'category': pd.Categorical.from_codes(rng.integers(0, 3, n), categories=['A', 'B', 'C']),
+            'size': rng.uniform(10, 100, n)
+        }, index=idx)
+    
+    def _3d_scatter_chunk(self, rng, idx, total, state):
+        n = len(idx)
+        x = rng.normal(0, 1, n)
+        y = rng.normal(0, 1, n)
+        
+        return pd.DataFrame({
+            'x': x,
+            'y': y,
+            'z': 0.5 * x + 0.3 * y + rng.normal(0, 0.5, n),
+            'color': pd.Categorical.from_codes(rng.integers(0, 3, n), categories=['red', 'blue', 'green']),
+            'size': rng.uniform(5, 20, n)
+        }, index=idx)
+    
+    def _area_chunk(self, rng, idx, total, state):
+        """Area rows idx of total; running totals carry over between chunks"""
+        n = len(idx)
+        carry = state.get('carry', np.zeros(3))
+        steps = np.column_stack([
+            rng.normal(1000, 200, n),
+            rng.normal(600, 150, n),
+            rng.normal(400, 100, n)
+        ])
+        totals = np.cumsum(steps, axis=0) + carry
+        state['carry'] = totals[-1]
+        
+        return pd.DataFrame({
+            'date': pd.date_range(start=pd.Timestamp('2023-01-01') + pd.Timedelta(minutes=int(idx[0])), periods=n, freq='min'),
+            'revenue': totals[:, 0],
+            'costs': totals[:, 1],
+            'profit': totals[:, 2]
+        }, index=idx)
+    
+    def _boxplot_chunk(self, rng, idx, total, state):
+        groups = ['Group A', 'Group B', 'Group C', 'Group D']
+        if 'means' not in state:
+            state['means'] = state['rng'].uniform(50, 150, len(groups))
+            state['stds'] = state['rng'].uniform(10, 30, len(groups))
+        codes = idx * len(groups) // total
+        
+        frame = self._grouped_normal_frame(rng, 'group', groups, codes, state['means'], state['stds'])
+        frame.index = idx
+        return frame
+    
+    def _histogram_chunk(self, rng, idx, total, state):
+        # Same two-component mixture as generate_histogram_data, split at the midpoint
+        n_first = int(np.count_nonzero(idx < total // 2))
+        values = np.concatenate([
+            rng.normal(50, 10, n_first),
+            rng.normal(80, 15, len(idx) - n_first)
+        ])
+        
+        return pd.DataFrame({'value': values}, index=idx)
+    
+    def _violin_chunk(self, rng, idx, total, state):
+        categories = ['Category 1', 'Category 2', 'Category 3', 'Category 4']
+        codes = idx * len(categories) // total
+        means = 50 + np.arange(len(categories)) * 20
+        stds = 10 + np.arange(len(categories)) * 5
+        
+        frame = self._grouped_normal_frame(rng, 'category', categories, codes, means, stds)
+        frame.index = idx
+        return frame
+    
+    def get_all_data(self, workers=None, sizes=None):
+        """Get all datasets as a lazy mapping; each is generated on first access
+
+        ``sizes`` maps dataset names to keyword arguments for their
+        generator, e.g. ``{'scatter': {'n_points': 10**6}}``. With
+        ``workers`` > 1 the datasets not already cached are generated up
+        front across a process pool. Columns come back as Arrow IPC
+        buffers, which avoids pickling every object in the frames. Pool
+        start-up costs a few hundred milliseconds, so this only pays off
+        for datasets sized well beyond the demo defaults.
+        """
+        sizes = sizes or {}
+        builders = {
+            name: functools.partial(getattr(self, method), **sizes.get(name, {}))
+            for name, method in DATASETS.items()
         }
+        generated = {}
+        if workers is not None and workers > 1:
+            generated = self._generate_parallel(
+                {name: (getattr(self, method), sizes.get(name, {})) for name, method in DATASETS.items()}, workers
+            )
+        return LazyDatasets(builders, generated)
+    
+    def _generate_parallel(self, jobs, workers):
+        """Generate datasets using a process pool; returns name -> dataset
+
+        ``jobs`` maps dataset names to (generator method, keyword arguments).
+        Results also go into the dataset cache, but are returned directly
+        so that large ones are not lost to cache eviction.
+        """
+        pending = {}
+        for name, (method, options) in jobs.items():
+            key = method.cache_key(self, **options)
+            if key not in self.cache:
+                pending[name] = (key, method.__name__, options)
+        if not pending:
+            return {}
+        
+        results = {}
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+            futures = {
+                pool.submit(_generate_for_worker, self.seed, method_name, options): (name, key)
+                for name, (key, method_name, options) in pending.items()
+            }
+            # Decode in the parent as results arrive, overlapping the workers still running
+            for future in as_completed(futures):
+                name, key = futures[future]
+                results[name] = self.cache.put(key, from_ipc(future.result()))
+        return results
 
 # Global instance
 data_gen = DataGenerator() 
\ No newline at end of file
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Shared data service for the Streamlit and Gradio front ends
+Generates datasets and figures once and serves them over a Unix socket
+"""
+
+import json
+import os
+import socket
+import socketserver
+import stat
+import sys
+import tempfile
+
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from data_generator import DataGenerator, from_ipc, to_ipc
+from registry import LazyChart
+from visualizations import RASTER_THRESHOLD, figure_spec
+
+# Front ends look for the service at this path (set by run_apps.py)
+SOCKET_ENV_VAR = 'DASHBOARD_DATA_SERVICE'
+SOCKET_NAME = 'data-service.sock'
+
+# Request arguments the service accepts. Sizes must be integers in
+# [1, limit]; options are strings (each chart checks its own choices).
+# n_points goes well past RASTER_THRESHOLD so remote scatters can reach the
+# density raster
+SERVICE_SIZE_LIMITS = {
+    'days': 3_660,
+    'n_points': 4 * RASTER_THRESHOLD,
+    'n_samples': 1_000_000,
+    'width': 10_000,
+    'bins': 1_000
+}
+SERVICE_OPTIONS = {'downsample', 'summary', 'binning'}
+
+# Charts that are not Plotly figures, or that depend on per-process state,
+# are always built locally
+LOCAL_VISUALIZATIONS = {'Map', 'Word Cloud'}
+
+
+class ServiceError(Exception):
+    """Raised when the data service rejects a request"""
+
+
+def default_socket_path():
+    """Socket path inside a directory only the current user can access
+
+    Uses $XDG_RUNTIME_DIR when set, else a per-user directory in the temp
+    directory, which is created with mode 0700. Raises RuntimeError if that
+    directory exists but is not private to this user.
+    """
+    base = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    directory = os.path.join(base, f'dashboard-{os.getuid()}')
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"{directory} is not a private directory owned by this user")
+    return os.path.join(directory, SOCKET_NAME)
+
+
+def check_arguments(kwargs):
+    """Reject request arguments that are unknown or out of bounds"""
+    if not isinstance(kwargs, dict):
+        raise ValueError("kwargs must be an object")
+    for name, value in kwargs.items():
+        if value is None:
+            continue
+        if name in SERVICE_SIZE_LIMITS:
+            limit = SERVICE_SIZE_LIMITS[name]
+            if isinstance(value, bool) or not isinstance(value, int) or not 0 < value <= limit:
+                raise ValueError(f"{name} must be an integer between 1 and {limit:,}")
+        elif name in SERVICE_OPTIONS:
+            if not isinstance(value, str):
+                raise ValueError(f"{name} must be a string")
+        elif name == 'x_range':
+            if not isinstance(value, list) or len(value) != 2 or not all(isinstance(v, (str, int, float)) for v in value):
+                raise ValueError("x_range must be a [start, end] pair")
+        else:
+            raise ValueError(f"Argument {name!r} is not accepted by the data service")
+
+
+def _remove_stale_socket(path):
+    """Remove a socket left behind by a previous service run
+
+    Anything else at path (a file, another user's socket, or a service that
+    still answers) is left alone and raises RuntimeError.
+    """
+    if not os.path.lexists(path):
+        return
+    info = os.lstat(path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise RuntimeError(f"{path} exists and is not a data service socket owned by this user")
+    if DataServiceClient(path, timeout=1).available():
+        raise RuntimeError(f"A data service is already listening on {path}")
+    os.unlink(path)
+
+
+class DataServiceHandler(socketserver.StreamRequestHandler):
+    """One request per connection: a JSON line in, a JSON header line plus payload out"""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            kind, payload = self.server.dispatch(request)
+        except Exception as e:
+            kind, payload = 'error', str(e).encode()
+        header = {'kind': kind, 'length': len(payload)}
+        self.wfile.write(json.dumps(header).encode() + b'\n')
+        self.wfile.write(payload)
+
+
+class DataServiceServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, data_gen, viz_gen):
+        _remove_stale_socket(path)
+        super().__init__(path, DataServiceHandler)
+        self.data_gen = data_gen
+        self.viz_gen = viz_gen
+    
+    def server_bind(self):
+        super().server_bind()
+        # Only the owner may connect, whatever the directory permissions
+        os.chmod(self.server_address, 0o600)
+
+    def dispatch(self, request):
+        """Run a request against the shared generators; returns (kind, payload bytes)"""
+        op = request.get('op')
+        kwargs = request.get('kwargs', {})
+        check_arguments(kwargs)
+        if op == 'ping':
+            return 'json', b'"pong"'
+        if op == 'refresh':
+            self.data_gen.refresh()
+            return 'json', b'null'
+        if op == 'summary':
+            return 'json', json.dumps(self.data_gen.summarize(request['name'])).encode()
+        if op == 'dataset':
+            method = request['method']
+            if not method.startswith('generate_') or not callable(getattr(self.data_gen, method, None)):
+                raise ValueError(f"Unknown dataset method: {method}")
+            data = getattr(self.data_gen, method)(**kwargs)
+            if not isinstance(data, pd.DataFrame):
+                return 'json', json.dumps(data).encode()
+            payload = to_ipc(data)
+            if payload is data:
+                raise RuntimeError("pyarrow is required to serve DataFrames")
+            return 'arrow', payload.to_pybytes()
+        if op == 'figure':
+            viz_type = request['viz']
+            functions = self.viz_gen.get_all_visualizations()
+            if viz_type not in functions:
+                raise ValueError(f"Unknown visualization: {viz_type}")
+            if viz_type in LOCAL_VISUALIZATIONS:
+                raise ValueError(f"{viz_type} is rendered by the front end")
+            # Sent without the default template, which the client re-applies.
+            # Cached charts hand over their stored JSON without building a figure
+            chart = functions[viz_type]
+            builder = chart.spec.load() if isinstance(chart, LazyChart) else None
+            if hasattr(builder, 'to_json'):
+                return 'json', builder.to_json(self.viz_gen, **kwargs).encode()
+            return 'json', pio.to_json(figure_spec(chart(**kwargs)), validate=False).encode()
+        raise ValueError(f"Unknown operation: {op}")
+
+
+class DataServiceClient:
+    """Blocking client for DataServiceServer"""
+
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self.timeout = timeout
+
+    def request(self, **request):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(self.timeout)
+            sock.connect(self.path)
+            stream = sock.makefile('rwb')
+            stream.write(json.dumps(request).encode() + b'\n')
+            stream.flush()
+            header = json.loads(stream.readline())
+            payload = stream.read(header['length'])
+        if header['kind'] == 'error':
+            raise ServiceError(payload.decode())
+        if header['kind'] == 'arrow':
+            return from_ipc(payload)
+        return json.loads(payload)
+
+    def available(self):
+        try:
+            return self.request(op='ping') == 'pong'
+        except OSError:
+            return False
+
+    def dataset(self, method, **kwargs):
+        return self.request(op='dataset', method=method, kwargs=kwargs)
+
+    def summary(self, name):
+        return self.request(op='summary', name=name)
+
+    def figure(self, viz_type, **kwargs):
+        return go.Figure(self.request(op='figure', viz=viz_type, kwargs=kwargs), skip_invalid=True)
+
+    def refresh(self):
+        self.request(op='refresh')
+
+
+class RemoteDataGenerator:
+    """DataGenerator stand-in that fetches datasets from the shared service
+
+    Falls back to the local generator if the service cannot be reached.
+    """
+
+    def __init__(self, client, local):
+        self.client = client
+        self.local = local
+
+    def __getattr__(self, name):
+        if not name.startswith('generate_'):
+            return getattr(self.local, name)
+
+        def fetch(**kwargs):
+            try:
+                return self.client.dataset(name, **kwargs)
+            except OSError:
+                return getattr(self.local, name)(**kwargs)
+        fetch.__name__ = name
+        return fetch
+
+    def summarize(self, name):
+        try:
+            return self.client.summary(name)
+        except OSError:
+            return self.local.summarize(name)
+
+    def refresh(self):
+        try:
+            self.client.refresh()
+        except OSError:
+            pass
+        self.local.refresh()
+
+    def get_all_data(self, workers=None, sizes=None):
+        """Lazy mapping of all datasets, each fetched from the service on first access"""
+        # The service does the generating, so there is nothing to parallelize here
+        return DataGenerator.get_all_data(self, sizes=sizes)
+
+
+class RemoteVisualizationGenerator:
+    """VisualizationGenerator stand-in that fetches Plotly figures from the shared service"""
+
+    def __init__(self, client, local):
+        self.client = client
+        self.local = local
+        self._dispatch = (None, None)
+
+    def __getattr__(self, name):
+        return getattr(self.local, name)
+
+    def _remote(self, viz_type, local_function):
+        def fetch(**kwargs):
+            try:
+                return self.client.figure(viz_type, **kwargs)
+            except OSError:
+                return local_function(**kwargs)
+        return fetch
+
+    def get_all_visualizations(self):
+        local_table = self.local.get_all_visualizations()
+        # Rebuilt only when the local table is (i.e. a chart type was registered)
+        if self._dispatch[0] is not local_table:
+            self._dispatch = (local_table, {
+                viz_type: function if viz_type in LOCAL_VISUALIZATIONS else self._remote(viz_type, function)
+                for viz_type, function in local_table.items()
+            })
+        return self._dispatch[1]
+
+
+def connect(data_gen, viz_gen):
+    """Use the shared service when one is configured and reachable, else the local generators"""
+    path = os.environ.get(SOCKET_ENV_VAR)
+    if not path or not hasattr(socket, 'AF_UNIX'):
+        return data_gen, viz_gen
+    client = DataServiceClient(path)
+    if not client.available():
+        return data_gen, viz_gen
+    return RemoteDataGenerator(client, data_gen), RemoteVisualizationGenerator(client, viz_gen)
+
+
+def main():
+    """Run the service in the foreground"""
+    from data_generator import data_gen
+    from visualizations import viz_gen
+
+    path = sys.argv[1] if len(sys.argv) > 1 else os.environ.get(SOCKET_ENV_VAR) or default_socket_path()
+    server = DataServiceServer(path, data_gen, viz_gen)
+    print(f"📡 Data service listening on {path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+import base64
+import json
+
+import numpy as np
+from plotly.utils import PlotlyJSONEncoder
+
+from cache import LRUCache
+
+# Trace attributes that hold per-point data and can be extended in place
+DATA_ATTRIBUTES = ('x', 'y', 'z', 'r', 'theta', 'text', 'customdata', 'values', 'labels')
+
+# Client-side counterpart of diff_figures: applies a patch to a rendered plot
+PATCH_JS = """
+function applyFigurePatch(gd, patch) {
+    if (patch.full) {
+        return Plotly.react(gd, patch.full.data, patch.full.layout);
+    }
+    patch.restyle.forEach(function (call) {
+        Plotly.restyle(gd, call.update, call.traces);
+    });
+    if (patch.extend) {
+        Plotly.extendTraces(gd, patch.extend.update, patch.extend.traces, patch.extend.max_points);
+    }
+    if (Object.keys(patch.relayout).length) {
+        Plotly.relayout(gd, patch.relayout);
+    }
+}
+"""
+
+
+def _decode(value):
+    """Turn a Plotly base64 typed-array spec back into a NumPy array"""
+    if isinstance(value, dict) and 'bdata' in value and 'dtype' in value:
+        array = np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype'])
+        return array.reshape(value['shape']) if 'shape' in value else array
+    return value
+
+
+def _figure_dict(fig):
+    """Figure as a dict with per-point data attributes as plain arrays"""
+    figure = fig if isinstance(fig, dict) else fig.to_dict()
+    data = [
+        {attr: _decode(value) if attr in DATA_ATTRIBUTES else value for attr, value in trace.items()}
+        for trace in figure.get('data', [])
+    ]
+    return {'data': data, 'layout': figure.get('layout', {})}
+
+
+def _as_array(value):
+    return value if isinstance(value, np.ndarray) else np.asarray(value)
+
+
+def _appended(old, new):
+    """Points appended to old to get new, and the window length if old also slid
+
+    Returns (tail, max_points) or None when new is not old plus a suffix,
+    possibly with points dropped from the front.
+    """
+    old, new = _as_array(old), _as_array(new)
+    if old.ndim != 1 or new.ndim != 1 or len(old) == 0 or len(new) < 1:
+        return None
+    for start in np.flatnonzero(old == new[0]):
+        kept = len(old) - start
+        if kept <= len(new) and np.array_equal(old[start:], new[:kept]):
+            return new[kept:], (len(new) if start > 0 else None)
+    return None
+
+
+def _changed(old, new):
+    if isinstance(old, (list, tuple, np.ndarray)) or isinstance(new, (list, tuple, np.ndarray)):
+        old, new = _as_array(old), _as_array(new)
+        return old.shape != new.shape or not np.array_equal(old, new)
+    return old != new
+
+
+def diff_figures(previous, current):
+    """Describe how to turn the previously sent figure into the current one
+
+    The patch lists Plotly.restyle calls, one Plotly.extendTraces call for
+    traces that only gained points (optionally dropping old ones), and a
+    Plotly.relayout update. When the trace structure changed the patch
+    carries the whole figure under 'full' instead.
+    """
+    previous, current = _figure_dict(previous), _figure_dict(current)
+    old_traces, new_traces = previous.get('data', []), current.get('data', [])
+    if [t.get('type') for t in old_traces] != [t.get('type') for t in new_traces]:
+        return {'full': current}
+
+    restyle, candidates = [], {}
+    for index, (old, new) in enumerate(zip(old_traces, new_traces)):
+        update = {}
+        changed_data = [a for a in DATA_ATTRIBUTES if a in new and (a not in old or _changed(old[a], new[a]))]
+        tails = {a: _appended(old[a], new[a]) for a in changed_data if a in old}
+        windows = {tail[1] for tail in tails.values() if tail is not None}
+        lengths = {len(tail[0]) for tail in tails.values() if tail is not None}
+        if changed_data and len(tails) == len(changed_data) and None not in tails.values() \
+                and len(windows) == 1 and len(lengths) == 1:
+            candidates[index] = (tuple(changed_data), windows.pop(), {a: tails[a][0] for a in changed_data})
+        else:
+            update.update({attr: [new[attr]] for attr in changed_data})
+
+        for attr in set(new) | set(old):
+            if attr in DATA_ATTRIBUTES:
+                continue
+            if attr not in new:
+                update[attr] = [None]
+            elif attr not in old or _changed(old[attr], new[attr]):
+                update[attr] = [new[attr]]
+        if update:
+            restyle.append({'update': update, 'traces': [index]})
+
+    # One extendTraces call covers every trace, so they must agree on the
+    # attributes and window; anything else is sent as a restyle
+    extend = None
+    if candidates:
+        shapes = {(attrs, window) for attrs, window, _ in candidates.values()}
+        if len(shapes) == 1:
+            attrs, window = shapes.pop()
+            traces = sorted(candidates)
+            extend = {
+                'update': {attr: [candidates[i][2][attr] for i in traces] for attr in attrs},
+                'traces': traces,
+                'max_points': window
+            }
+        else:
+            for index in sorted(candidates):
+                restyle.append({'update': {a: [new_traces[index][a]] for a in candidates[index][0]},
+                                'traces': [index]})
+
+    old_layout, new_layout = previous.get('layout', {}), current.get('layout', {})
+    relayout = {key: new_layout.get(key) for key in set(old_layout) | set(new_layout)
+                if key not in old_layout or key not in new_layout or _changed(old_layout[key], new_layout[key])}
+
+    return {
+        'restyle': restyle,
+        'extend': extend,
+        'relayout': relayout
+    }
+
+
+def apply_patch(figure, patch):
+    """Apply a patch from diff_figures to a figure dict on the server
+
+    Mirrors what PATCH_JS does in the browser; useful for keeping a server
+    copy of the client state and for front ends that only accept full figures.
+    """
+    if patch.get('full') is not None:
+        return patch['full']
+    figure = _figure_dict(figure)
+    data = [dict(trace) for trace in figure.get('data', [])]
+    for call in patch['restyle']:
+        for attr, values in call['update'].items():
+            for index in call['traces']:
+                if values[0] is None:
+                    data[index].pop(attr, None)
+                else:
+                    data[index][attr] = values[0]
+    if patch.get('extend'):
+        extend = patch['extend']
+        for attr, tails in extend['update'].items():
+            for index, tail in zip(extend['traces'], tails):
+                grown = np.concatenate([_as_array(data[index][attr]), _as_array(tail)])
+                if extend['max_points']:
+                    grown = grown[-extend['max_points']:]
+                data[index][attr] = grown
+    layout = dict(figure.get('layout', {}))
+    for key, value in patch['relayout'].items():
+        if value is None:
+            layout.pop(key, None)
+        else:
+            layout[key] = value
+    return {'data': data, 'layout': layout}
+
+
+def patch_to_json(patch):
+    """Serialize a patch for the browser"""
+    return json.dumps(patch, cls=PlotlyJSONEncoder)
+
+
+class FigurePatcher:
+    """Remember the last figure sent to each client and produce patches against it"""
+
+    def __init__(self, max_entries=256):
+        self.sent = LRUCache(max_entries=max_entries, sizeof=lambda value: 0)
+
+    def update(self, client_id, chart, fig):
+        """Patch for this client's copy of chart; the whole figure on first send"""
+        current = _figure_dict(fig)
+        previous = self.sent.get((client_id, chart))
+        self.sent.put((client_id, chart), current)
+        if previous is None:
+            return {'full': current}
+        return diff_figures(previous, current)
+
+    def forget(self, client_id):
+        """Drop all figures remembered for a client"""
+        self.sent.invalidate(lambda key: key[0] == client_id)
@@ -0,0 +1,28 @@
+import gradio as gr
+from plotly.basedatatypes import BaseFigure
+
+MAP_PLACEHOLDER = """
+<div style="background-color: #262730; padding: 2rem; border-radius: 0.5rem; text-align: center;">
+    <h3>🌍 Map Visualization</h3>
+    <p>Map visualization is available in the Streamlit version.</p>
+    <p>This shows geographic data points across global locations.</p>
+</div>
+"""
+
+
+def render(result):
+    """Output value for a visualization result: Plotly figures as-is, maps as HTML"""
+    if isinstance(result, BaseFigure):
+        return result
+    if type(result).__module__.startswith('pydeck'):
+        return gr.HTML(result.to_html(as_string=True))
+    return gr.HTML(result._repr_html_())
+
+
+def render_error(error):
+    return gr.HTML(f"""
+        <div style="background-color: #ff6b6b; padding: 1rem; border-radius: 0.5rem; color: white;">
+            <h3>Error</h3>
+            <p>Error creating visualization: {str(error)}</p>
+        </div>
+        """)
@@ -2,14 +2,24 @@ import gradio as gr
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
-import folium
 import pandas as pd
 import numpy as np
 from PIL import Image
 import io
 import base64
 from data_generator import data_gen
-from visualizations import viz_gen
+from visualizations import viz_gen, WORDCLOUD_DIR
+from data_service import connect
+from registry import chart_registry
+from gradio_adapter import render, render_error, MAP_PLACEHOLDER
+from summaries import chart_summary
+from streaming import LIVE_TICK_SECONDS, LiveWindow, get_live_feed
+
+# Use the shared data service when run_apps.py started one
+data_gen, viz_gen = connect(data_gen, viz_gen)
+
+# Gradio serves files from allowed paths under /file=
+viz_gen.wordclouds.url_prefix = f"/file={WORDCLOUD_DIR}"
 
 # Custom CSS for dark theme
 custom_css = """
@@ -109,187 +119,25 @@ def create_visualization(viz_type, refresh_data=False):
         viz_function = viz_gen.get_all_visualizations()[viz_type]
         
         if viz_type == "Map":
-            # For map visualization, we'll return a placeholder since Gradio doesn't handle Folium well
-            return gr.HTML("""
-            <div style="background-color: #262730; padding: 2rem; border-radius: 0.5rem; text-align: center;">
-                <h3>🌍 Map Visualization</h3>
-                <p>Map visualization is available in the Streamlit version.</p>
-                <p>This shows geographic data points across global locations.</p>
-            </div>
-            """)
-        else:
-            fig = viz_function()
-            return fig
+            # The gr.Plot output cannot show folium maps
+            return gr.HTML(MAP_PLACEHOLDER)
+        return render(viz_function())
             
     except Exception as e:
-        return gr.HTML(f"""
-        <div style="background-color: #ff6b6b; padding: 1rem; border-radius: 0.5rem; color: white;">
-            <h3>Error</h3>
-            <p>Error creating visualization: {str(e)}</p>
-        </div>
-        """)
+        return render_error(e)
 
 def get_data_summary(viz_type):
     """Get data summary for the selected visualization"""
     try:
-        if viz_type in ["Line Chart", "Area Chart"]:
-            data = data_gen.generate_time_series_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Time Range:</strong> {data['date'].min().strftime('%Y-%m-%d')} to {data['date'].max().strftime('%Y-%m-%d')}</p>
-                <p><strong>Data Points:</strong> {len(data):,}</p>
-                <p><strong>Value Range:</strong> {data['value'].min():.2f} - {data['value'].max():.2f}</p>
-                <p><strong>Average Value:</strong> {data['value'].mean():.2f}</p>
-            </div>
-            """
-        
-        elif viz_type == "Bar Chart":
-            data = data_gen.generate_categorical_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Categories:</strong> {len(data)}</p>
-                <p><strong>Value Range:</strong> {data['value'].min():.2f} - {data['value'].max():.2f}</p>
-                <p><strong>Top Category:</strong> {data.loc[data['value'].idxmax(), 'category']}</p>
-                <p><strong>Average Value:</strong> {data['value'].mean():.2f}</p>
-            </div>
-            """
-        
-        elif viz_type == "Scatter Plot":
-            data = data_gen.generate_scatter_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Data Points:</strong> {len(data):,}</p>
-                <p><strong>Categories:</strong> {data['category'].nunique()}</p>
-                <p><strong>Correlation:</strong> {data['x'].corr(data['y']):.3f}</p>
-                <p><strong>Size Range:</strong> {data['size'].min():.1f} - {data['size'].max():.1f}</p>
-            </div>
-            """
-        
-        elif viz_type == "Pie Chart":
-            data = data_gen.generate_pie_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Categories:</strong> {len(data)}</p>
-                <p><strong>Total Value:</strong> {data['value'].sum()}</p>
-                <p><strong>Largest Share:</strong> {data.loc[data['value'].idxmax(), 'category']} ({data.loc[data['value'].idxmax(), 'percentage']:.1f}%)</p>
-            </div>
-            """
-        
-        elif viz_type == "Heatmap":
-            data = data_gen.generate_heatmap_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Matrix Size:</strong> {data.shape[0]}x{data.shape[1]}</p>
-                <p><strong>Value Range:</strong> {data.values.min():.3f} - {data.values.max():.3f}</p>
-                <p><strong>Average Correlation:</strong> {data.values.mean():.3f}</p>
-            </div>
-            """
-        
-        elif viz_type == "3D Scatter":
-            data = data_gen.generate_3d_scatter_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Data Points:</strong> {len(data):,}</p>
-                <p><strong>Color Categories:</strong> {data['color'].nunique()}</p>
-                <p><strong>Size Range:</strong> {data['size'].min():.1f} - {data['size'].max():.1f}</p>
-            </div>
-            """
-        
-        elif viz_type == "Box Plot":
-            data = data_gen.generate_boxplot_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Groups:</strong> {data['group'].nunique()}</p>
-                <p><strong>Total Points:</strong> {len(data):,}</p>
-                <p><strong>Value Range:</strong> {data['value'].min():.2f} - {data['value'].max():.2f}</p>
-            </div>
-            """
-        
-        elif viz_type == "Histogram":
-            data = data_gen.generate_histogram_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Data Points:</strong> {len(data):,}</p>
-                <p><strong>Value Range:</strong> {data['value'].min():.2f} - {data['value'].max():.2f}</p>
-                <p><strong>Mean:</strong> {data['value'].mean():.2f}</p>
-                <p><strong>Std Dev:</strong> {data['value'].std():.2f}</p>
-            </div>
-            """
-        
-        elif viz_type == "Violin Plot":
-            data = data_gen.generate_violin_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Categories:</strong> {data['category'].nunique()}</p>
-                <p><strong>Total Points:</strong> {len(data):,}</p>
-                <p><strong>Value Range:</strong> {data['value'].min():.2f} - {data['value'].max():.2f}</p>
-            </div>
-            """
-        
-        elif viz_type == "Word Cloud":
-            words = data_gen.generate_wordcloud_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Unique Words:</strong> {len(words)}</p>
-                <p><strong>Max Frequency:</strong> {max(words.values())}</p>
-                <p><strong>Min Frequency:</strong> {min(words.values())}</p>
-            </div>
-            """
-        
-        elif viz_type == "Map":
-            data = data_gen.generate_map_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Locations:</strong> {len(data)}</p>
-                <p><strong>Value Range:</strong> {data['value'].min()} - {data['value'].max()}</p>
-                <p><strong>Top Location:</strong> {data.loc[data['value'].idxmax(), 'city']}</p>
-            </div>
-            """
-        
-        elif viz_type == "Gauge Chart":
-            data = data_gen.generate_gauge_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Metrics:</strong> {len(data)}</p>
-                <p><strong>Average Usage:</strong> {data['percentage'].mean():.1f}%</p>
-                <p><strong>Highest Usage:</strong> {data.loc[data['percentage'].idxmax(), 'metric']}</p>
-            </div>
-            """
-        
-        elif viz_type == "Funnel Chart":
-            data = data_gen.generate_funnel_data()
-            summary = f"""
-            <div class="metric-card">
-                <h4>📊 Data Summary</h4>
-                <p><strong>Stages:</strong> {len(data)}</p>
-                <p><strong>Total Visitors:</strong> {data['value'].max():,}</p>
-                <p><strong>Conversion Rate:</strong> {data['conversion_rate'].min():.1f}%</p>
-            </div>
-            """
-        
-        elif viz_type == "Radar Chart":
-            data = data_gen.generate_radar_data()
+        rows = chart_summary(viz_type, data_gen)
+        if rows:
+            lines = "".join(f"<p><strong>{label}:</strong> {value}</p>" for label, value in rows)
             summary = f"""
             <div class="metric-card">
                 <h4>📊 Data Summary</h4>
-                <p><strong>Categories:</strong> {len(data)}</p>
-                <p><strong>Products:</strong> 3</p>
-                <p><strong>Score Range:</strong> 0-100</p>
+                {lines}
             </div>
             """
-        
         else:
             summary = """
             <div class="metric-card">
@@ -310,39 +158,20 @@ def get_data_summary(viz_type):
 
 def get_visualization_description(viz_type):
     """Get description for the selected visualization"""
-    descriptions = {
-        "Line Chart": "Time series analysis showing trends over time with seasonal patterns and noise.",
-        "Bar Chart": "Categorical comparison across different industry sectors with performance metrics.",
-        "Scatter Plot": "Correlation analysis between variables with categorical grouping and size encoding.",
-        "Pie Chart": "Distribution analysis showing market share across different device types.",
-        "Heatmap": "Correlation matrix visualization for multiple variables with color-coded intensity.",
-        "3D Scatter": "Multi-dimensional data exploration in three-dimensional space.",
-        "Area Chart": "Cumulative financial performance showing revenue, costs, and profit trends.",
-        "Box Plot": "Statistical distribution analysis with quartiles and outliers by group.",
-        "Histogram": "Frequency distribution showing the spread and shape of data values.",
-        "Violin Plot": "Density distribution visualization combining box plot and kernel density estimation.",
-        "Word Cloud": "Text analysis showing frequency and importance of key terms.",
-        "Map": "Geographic visualization of data points across global locations.",
-        "Gauge Chart": "Progress indicators for system metrics and performance monitoring.",
-        "Funnel Chart": "Conversion analysis showing the flow through different stages.",
-        "Radar Chart": "Multi-dimensional comparison of different products across various attributes."
-    }
-    
     return gr.HTML(f"""
     <div class="metric-card">
         <h4>📋 Visualization Info</h4>
-        <p><strong>Description:</strong> {descriptions.get(viz_type, 'Interactive data visualization.')}</p>
+        <p><strong>Description:</strong> {chart_registry.describe(viz_type)}</p>
     </div>
     """)
 
 def get_quick_stats():
     """Get quick statistics"""
     try:
-        all_data = data_gen.get_all_data()
-        time_series_data = all_data['time_series']
-        total_points = len(time_series_data)
-        avg_value = time_series_data['value'].mean()
-        max_value = time_series_data['value'].max()
+        stats = data_gen.summarize('time_series')
+        total_points = stats['rows']
+        avg_value = stats['numeric']['value']['mean']
+        max_value = stats['numeric']['value']['max']
         
         return gr.HTML(f"""
         <div class="metric-card">
@@ -376,7 +205,7 @@ def main():
                 gr.Markdown("## 🎛️ Dashboard Controls")
                 
                 # Visualization selector
-                viz_options = list(viz_gen.get_all_visualizations().keys())
+                viz_options = chart_registry.names()
                 viz_selector = gr.Dropdown(
                     choices=viz_options,
                     value=viz_options[0],
@@ -384,6 +213,11 @@ def main():
                     interactive=True
                 )
                 
+                # Live streaming for the line chart, driven by a timer
+                live_toggle = gr.Checkbox(label="🔴 Live mode (Line Chart)", value=False)
+                live_timer = gr.Timer(LIVE_TICK_SECONDS, active=False)
+                live_window = gr.State(None)
+                
                 gr.Markdown("---")
                 
                 # Data controls
@@ -419,10 +253,29 @@ def main():
         
         # Event handlers
         def update_visualization(viz_type):
-            return create_visualization(viz_type), get_visualization_description(viz_type), get_data_summary(viz_type)
+            description, summary = get_visualization_description(viz_type), get_data_summary(viz_type)
+            yield create_visualization(viz_type), description, summary
+            # Word clouds render in the background; follow the placeholder with the image
+            if viz_type == "Word Cloud" and not viz_gen.wordcloud_job().done():
+                viz_gen.wordcloud_job().result()
+                yield create_visualization(viz_type), description, summary
+        
+        def toggle_live(enabled, viz_type):
+            # Restore the static chart when live mode is switched off
+            plot = gr.update() if enabled else create_visualization(viz_type)
+            return gr.Timer(active=enabled), plot
+        
+        def live_tick(viz_type, window):
+            if viz_type != "Line Chart":
+                return gr.update(), window
+            window = window or LiveWindow()
+            window.pull(get_live_feed().buffer)
+            return viz_gen.create_live_line_chart(window.times, window.values), window
         
-        def refresh_all():
-            return get_quick_stats()
+        def refresh_all(viz_type):
+            data_gen.refresh()
+            return (create_visualization(viz_type), get_visualization_description(viz_type),
+                    get_data_summary(viz_type), get_quick_stats())
         
         # Connect events
         viz_selector.change(
@@ -431,9 +284,22 @@ def main():
             outputs=[viz_output, description_output, data_summary_output]
         )
         
+        live_toggle.change(
+            fn=toggle_live,
+            inputs=[live_toggle, viz_selector],
+            outputs=[live_timer, viz_output]
+        )
+        
+        live_timer.tick(
+            fn=live_tick,
+            inputs=[viz_selector, live_window],
+            outputs=[viz_output, live_window]
+        )
+        
         refresh_btn.click(
             fn=refresh_all,
-            outputs=[quick_stats]
+            inputs=[viz_selector],
+            outputs=[viz_output, description_output, data_summary_output, quick_stats]
         )
         
         # Initialize
@@ -451,5 +317,6 @@ if __name__ == "__main__":
         server_name="0.0.0.0",
         server_port=7860,
         share=False,
-        show_error=True
+        show_error=True,
+        allowed_paths=[WORDCLOUD_DIR]
     ) 
\ No newline at end of file
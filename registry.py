@@ -0,0 +1,134 @@
+import importlib
+import threading
+
+# Rough cost of building a chart at default sizes, for front ends that want
+# to warn before or prefetch expensive charts
+CHART_COSTS = ('low', 'medium', 'high')
+
+DEFAULT_DESCRIPTION = 'Interactive data visualization.'
+
+
+class ChartSpec:
+    """Metadata for one chart type plus the "module:attr" path of its builder
+
+    The builder is called with the VisualizationGenerator as its first
+    argument, so unbound VisualizationGenerator methods work as targets.
+    """
+
+    def __init__(self, name, target, description=DEFAULT_DESCRIPTION, dataset=None, cost='low'):
+        if cost not in CHART_COSTS:
+            raise ValueError(f"Unknown cost {cost!r}; expected one of {CHART_COSTS}")
+        self.name = name
+        self.target = target
+        self.description = description
+        # Key into DataGenerator.get_all_data() for the dataset the chart draws
+        self.dataset = dataset
+        self.cost = cost
+        self._builder = None
+
+    @property
+    def loaded(self):
+        return self._builder is not None
+
+    def load(self):
+        """Import the builder on first use"""
+        if self._builder is None:
+            module_name, _, attr = self.target.partition(':')
+            builder = importlib.import_module(module_name)
+            for part in attr.split('.'):
+                builder = getattr(builder, part)
+            self._builder = builder
+        return self._builder
+
+
+class LazyChart:
+    """Chart function bound to a generator; the builder is imported on first call"""
+
+    def __init__(self, spec, owner):
+        self.spec = spec
+        self.owner = owner
+
+    def __call__(self, *args, **kwargs):
+        return self.spec.load()(self.owner, *args, **kwargs)
+
+
+class ChartRegistry:
+    """Ordered registry of chart types"""
+
+    def __init__(self):
+        self._specs = {}
+        self._lock = threading.Lock()
+        # Bumped on every registration so cached dispatch tables can be rebuilt
+        self.version = 0
+
+    def __contains__(self, name):
+        return name in self._specs
+
+    def __getitem__(self, name):
+        return self._specs[name]
+
+    def __iter__(self):
+        return iter(list(self._specs.values()))
+
+    def register(self, name, target, **metadata):
+        """Register (or replace) a chart type; see ChartSpec for the metadata"""
+        spec = ChartSpec(name, target, **metadata)
+        with self._lock:
+            self._specs[name] = spec
+            self.version += 1
+        return spec
+
+    def names(self):
+        return list(self._specs)
+
+    def describe(self, name):
+        spec = self._specs.get(name)
+        return spec.description if spec is not None else DEFAULT_DESCRIPTION
+
+    def dispatch(self, owner):
+        """Name → callable for every registered chart, bound to owner"""
+        return {name: LazyChart(spec, owner) for name, spec in self._specs.items()}
+
+
+# Global instance
+chart_registry = ChartRegistry()
+
+# Built-in chart types, in display order
+_BUILTIN_CHARTS = [
+    ('Line Chart', 'create_line_chart', 'time_series', 'low',
+     "Time series analysis showing trends over time with seasonal patterns and noise."),
+    ('Bar Chart', 'create_bar_chart', 'categorical', 'low',
+     "Categorical comparison across different industry sectors with performance metrics."),
+    ('Scatter Plot', 'create_scatter_plot', 'scatter', 'low',
+     "Correlation analysis between variables with categorical grouping and size encoding."),
+    ('Pie Chart', 'create_pie_chart', 'pie', 'low',
+     "Distribution analysis showing market share across different device types."),
+    ('Heatmap', 'create_heatmap', 'heatmap', 'low',
+     "Correlation matrix visualization for multiple variables with color-coded intensity."),
+    ('3D Scatter', 'create_3d_scatter', '3d_scatter', 'medium',
+     "Multi-dimensional data exploration in three-dimensional space."),
+    ('Area Chart', 'create_area_chart', 'area', 'low',
+     "Cumulative financial performance showing revenue, costs, and profit trends."),
+    ('Box Plot', 'create_box_plot', 'boxplot', 'medium',
+     "Statistical distribution analysis with quartiles and outliers by group."),
+    ('Histogram', 'create_histogram', 'histogram', 'low',
+     "Frequency distribution showing the spread and shape of data values."),
+    ('Violin Plot', 'create_violin_plot', 'violin', 'medium',
+     "Density distribution visualization combining box plot and kernel density estimation."),
+    ('Word Cloud', 'create_wordcloud', 'wordcloud', 'high',
+     "Text analysis showing frequency and importance of key terms."),
+    ('Map', 'create_map_visualization', 'map', 'medium',
+     "Geographic visualization of data points across global locations."),
+    ('Gauge Chart', 'create_gauge_chart', 'gauge', 'low',
+     "Progress indicators for system metrics and performance monitoring."),
+    ('Funnel Chart', 'create_funnel_chart', 'funnel', 'low',
+     "Conversion analysis showing the flow through different stages."),
+    ('Radar Chart', 'create_radar_chart', 'radar', 'low',
+     "Multi-dimensional comparison of different products across various attributes."),
+]
+
+for _name, _method, _dataset, _cost, _description in _BUILTIN_CHARTS:
+    chart_registry.register(
+        _name, f'visualizations:VisualizationGenerator.{_method}',
+        description=_description, dataset=_dataset, cost=_cost
+    )
@@ -7,6 +7,7 @@ Run either Streamlit or Gradio application
 import sys
 import subprocess
 import os
+import socket
 import time
 import webbrowser
 from pathlib import Path
@@ -65,7 +66,8 @@ def run_streamlit():
             sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
             "--server.port", "8501",
             "--server.address", "localhost",
-            "--browser.gatherUsageStats", "false"
+            "--browser.gatherUsageStats", "false",
+            "--server.enableStaticServing", "true"
         ])
     except KeyboardInterrupt:
         print("\n🛑 Streamlit application stopped.")
@@ -87,6 +89,38 @@ def run_gradio():
     except Exception as e:
         print(f"❌ Error running Gradio: {e}")
 
+def start_data_service(timeout=30):
+    """Start the shared data service and point both apps at it
+
+    Returns the service process, or None if it could not be started, in
+    which case each app generates its own data.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+    
+    from data_service import DataServiceClient, SOCKET_ENV_VAR, default_socket_path
+    
+    print("📡 Starting shared data service...")
+    try:
+        path = default_socket_path()
+    except RuntimeError as e:
+        print(f"⚠️  {e}; each app will generate its own data.")
+        return None
+    # The service itself clears a stale socket at path, and refuses anything else
+    process = subprocess.Popen([sys.executable, "data_service.py", path])
+    client = DataServiceClient(path, timeout=1)
+    deadline = time.time() + timeout
+    while time.time() < deadline and process.poll() is None:
+        if client.available():
+            # Child processes inherit the socket path
+            os.environ[SOCKET_ENV_VAR] = path
+            return process
+        time.sleep(0.2)
+    
+    print("⚠️  Data service did not start; each app will generate its own data.")
+    process.terminate()
+    return None
+
 def run_both():
     """Run both applications"""
     print("🚀 Starting both applications...")
@@ -95,13 +129,16 @@ def run_both():
     print("⏹️  Press Ctrl+C to stop both applications")
     print("-" * 60)
     
+    service_process = start_data_service()
+    
     try:
         # Start Streamlit in background
         streamlit_process = subprocess.Popen([
             sys.executable, "-m", "streamlit", "run", "streamlit_app.py",
             "--server.port", "8501",
             "--server.address", "localhost",
-            "--browser.gatherUsageStats", "false"
+            "--browser.gatherUsageStats", "false",
+            "--server.enableStaticServing", "true"
         ])
         
         # Wait a moment for Streamlit to start
@@ -132,6 +169,9 @@ def run_both():
         print("✅ Both applications stopped.")
     except Exception as e:
         print(f"❌ Error running applications: {e}")
+    finally:
+        if service_process is not None:
+            service_process.terminate()
 
 def show_help():
     """Show help information"""
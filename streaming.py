@@ -0,0 +1,135 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from data_generator import data_gen
+
+# Live mode defaults: points kept for the chart and producer tick rate
+LIVE_CAPACITY = 5_000
+LIVE_TICK_SECONDS = 1.0
+LIVE_POINTS_PER_TICK = 5
+
+
+class RingBuffer:
+    """Fixed-capacity time/value buffer with sequence numbers for incremental reads"""
+
+    def __init__(self, capacity=LIVE_CAPACITY):
+        self.capacity = capacity
+        self.times = np.empty(capacity, dtype='datetime64[ns]')
+        self.values = np.empty(capacity, dtype=np.float64)
+        # Total points ever appended; the newest point has sequence total - 1
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    def append(self, times, values):
+        """Append arrays of points, overwriting the oldest once full"""
+        times = np.asarray(times, dtype='datetime64[ns]')[-self.capacity:]
+        values = np.asarray(values, dtype=np.float64)[-self.capacity:]
+        with self._lock:
+            start = self.total % self.capacity
+            first = min(len(values), self.capacity - start)
+            self.times[start:start + first] = times[:first]
+            self.values[start:start + first] = values[:first]
+            # Wrap the remainder around to the front
+            self.times[:len(values) - first] = times[first:]
+            self.values[:len(values) - first] = values[first:]
+            self.total += len(values)
+
+    def since(self, sequence):
+        """Points appended after sequence, oldest first, and the new sequence to pass next time
+
+        If the caller fell behind by more than the capacity, only the points
+        still buffered are returned.
+        """
+        with self._lock:
+            oldest = max(self.total - self.capacity, 0)
+            first = max(sequence, oldest)
+            positions = np.arange(first, self.total) % self.capacity
+            return self.times[positions], self.values[positions], self.total
+
+    def snapshot(self):
+        """All buffered points, oldest first"""
+        times, values, _ = self.since(0)
+        return times, values
+
+
+class LiveTimeSeries:
+    """Background producer that appends new time series points to a ring buffer"""
+
+    def __init__(self, capacity=LIVE_CAPACITY, tick=LIVE_TICK_SECONDS, points_per_tick=LIVE_POINTS_PER_TICK):
+        self.buffer = RingBuffer(capacity)
+        self.tick = tick
+        self.points_per_tick = points_per_tick
+        self._rng = data_gen.rng('live')
+        self._level = 125.0
+        self._clock = pd.Timestamp.now().floor('s').to_datetime64()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start producing points (no-op if already running)"""
+        if not self.running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='live-time-series', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.produce()
+            self._stop.wait(self.tick)
+
+    def produce(self):
+        """Append one tick's worth of points: a mean-reverting walk like the static series"""
+        n = self.points_per_tick
+        step = np.timedelta64(int(self.tick * 1e9) // n, 'ns')
+        times = self._clock + step * np.arange(1, n + 1)
+        shocks = self._rng.normal(0, 1.5, n)
+        values = np.empty(n)
+        for i in range(n):
+            self._level += 0.05 * (125.0 - self._level) + shocks[i]
+            values[i] = self._level
+        self._clock = times[-1]
+        self.buffer.append(times, values)
+
+
+class LiveWindow:
+    """A front end's copy of the latest points, advanced only by what is new each tick"""
+
+    def __init__(self, capacity=LIVE_CAPACITY):
+        self.capacity = capacity
+        self.times = np.empty(0, dtype='datetime64[ns]')
+        self.values = np.empty(0, dtype=np.float64)
+        self.sequence = 0
+
+    def pull(self, buffer):
+        """Fetch points appended since the last pull; returns how many arrived"""
+        times, values, self.sequence = buffer.since(self.sequence)
+        if len(values):
+            self.times = np.concatenate([self.times, times])[-self.capacity:]
+            self.values = np.concatenate([self.values, values])[-self.capacity:]
+        return len(values)
+
+
+_live_feed = None
+_live_lock = threading.Lock()
+
+
+def get_live_feed():
+    """Shared live feed for this process, started on first use"""
+    global _live_feed
+    with _live_lock:
+        if _live_feed is None:
+            _live_feed = LiveTimeSeries()
+        return _live_feed.start()
@@ -0,0 +1,23 @@
+import streamlit as st
+from plotly.basedatatypes import BaseFigure
+
+
+def render(result, container=None, width=800, height=400):
+    """Draw a visualization result: a Plotly figure, folium map or pydeck deck
+
+    ``container`` is any Streamlit container (st.empty(), a column, ...);
+    defaults to the main page.
+    """
+    target = st if container is None else container
+    if isinstance(result, BaseFigure):
+        target.plotly_chart(result, use_container_width=True, theme="streamlit")
+    elif type(result).__module__.startswith('pydeck'):
+        target.pydeck_chart(result)
+    else:
+        # Imported here so other charts do not pay for folium at start-up
+        from streamlit_folium import folium_static
+        if container is None:
+            folium_static(result, width=width, height=height)
+        else:
+            with container:
+                folium_static(result, width=width, height=height)
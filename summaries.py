@@ -0,0 +1,264 @@
+import numpy as np
+import pandas as pd
+
+from registry import chart_registry
+
+# Correlations are only kept for frames with at most this many numeric columns
+MAX_CORRELATION_COLUMNS = 16
+
+
+def _label_column(frame):
+    """First text or categorical column, used to name the row behind a maximum"""
+    for column in frame.columns:
+        dtype = frame[column].dtype
+        if isinstance(dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(dtype):
+            return column
+    return None
+
+
+def describe_frame(frame):
+    """Per-column statistics of a DataFrame, as plain Python values
+
+    All numeric columns are stacked into one float64 block and reduced along
+    the rows, so min/max/mean/std/sum/argmax and the correlation matrix for
+    every column come from a handful of NumPy reductions rather than one
+    pandas call per statistic.
+    """
+    n = len(frame)
+    stats = {'rows': n, 'numeric': {}, 'dates': {}, 'distinct': {}}
+
+    numeric = frame.select_dtypes('number')
+    if n and numeric.shape[1]:
+        block = numeric.to_numpy(dtype=np.float64)
+        sums = block.sum(axis=0)
+        std = block.std(axis=0, ddof=1) if n > 1 else np.full(block.shape[1], np.nan)
+        argmax = block.argmax(axis=0)
+        labels = _label_column(frame)
+        label_values = frame[labels].to_numpy() if labels is not None else None
+        for i, (column, low, high) in enumerate(zip(numeric.columns, block.min(axis=0), block.max(axis=0))):
+            stats['numeric'][column] = {
+                'min': float(low),
+                'max': float(high),
+                'sum': float(sums[i]),
+                'mean': float(sums[i] / n),
+                'std': float(std[i]),
+                'last': float(block[-1, i]),
+                'top': str(label_values[argmax[i]]) if label_values is not None else None
+            }
+        if 1 < n and block.shape[1] <= MAX_CORRELATION_COLUMNS:
+            with np.errstate(invalid='ignore', divide='ignore'):
+                stats['correlation'] = {
+                    'columns': list(numeric.columns),
+                    'matrix': np.corrcoef(block, rowvar=False).reshape(block.shape[1], -1).tolist()
+                }
+
+    for column in frame.columns:
+        series = frame[column]
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            if n:
+                values = series.to_numpy()
+                stats['dates'][column] = {'min': str(values.min())[:10], 'max': str(values.max())[:10]}
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            # Codes are already integers; count the categories that occur
+            codes = series.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+            stats['distinct'][column] = int(np.count_nonzero(counts))
+        elif pd.api.types.is_string_dtype(series.dtype):
+            stats['distinct'][column] = int(len(pd.unique(series.to_numpy())))
+    return stats
+
+
+def summarize_dataset(data):
+    """Statistics for a generated dataset: a DataFrame or a word -> frequency dict"""
+    if isinstance(data, pd.DataFrame):
+        return describe_frame(data)
+    frequencies = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+    return {
+        'words': len(data),
+        'max_frequency': float(frequencies.max()) if len(data) else 0.0,
+        'min_frequency': float(frequencies.min()) if len(data) else 0.0
+    }
+
+
+def _value_range(column, digits=2):
+    return f"{column['min']:.{digits}f} - {column['max']:.{digits}f}"
+
+
+def _correlation(stats, a, b):
+    correlation = stats['correlation']
+    columns = correlation['columns']
+    return correlation['matrix'][columns.index(a)][columns.index(b)]
+
+
+def _line_rows(stats):
+    value, dates = stats['numeric']['value'], stats['dates']['date']
+    return [
+        ('Time Range', f"{dates['min']} to {dates['max']}"),
+        ('Data Points', f"{stats['rows']:,}"),
+        ('Value Range', _value_range(value)),
+        ('Average Value', f"{value['mean']:.2f}")
+    ]
+
+
+def _area_rows(stats):
+    # The area columns are running totals, so the period total is the last row
+    numeric, dates = stats['numeric'], stats['dates']['date']
+    revenue, profit = numeric['revenue']['last'], numeric['profit']['last']
+    return [
+        ('Time Range', f"{dates['min']} to {dates['max']}"),
+        ('Total Revenue', f"{revenue:,.0f}"),
+        ('Total Costs', f"{numeric['costs']['last']:,.0f}"),
+        ('Total Profit', f"{profit:,.0f}"),
+        ('Profit Margin', f"{profit / revenue * 100:.1f}%" if revenue else 'n/a')
+    ]
+
+
+def _bar_rows(stats):
+    value = stats['numeric']['value']
+    return [
+        ('Categories', f"{stats['rows']}"),
+        ('Value Range', _value_range(value)),
+        ('Top Category', value['top']),
+        ('Average Value', f"{value['mean']:.2f}")
+    ]
+
+
+def _scatter_rows(stats):
+    size = stats['numeric']['size']
+    return [
+        ('Data Points', f"{stats['rows']:,}"),
+        ('Categories', f"{stats['distinct']['category']}"),
+        ('Correlation', f"{_correlation(stats, 'x', 'y'):.3f}"),
+        ('Size Range', _value_range(size, 1))
+    ]
+
+
+def _pie_rows(stats):
+    value, share = stats['numeric']['value'], stats['numeric']['percentage']
+    return [
+        ('Categories', f"{stats['rows']}"),
+        ('Total Value', f"{value['sum']:.0f}"),
+        ('Largest Share', f"{value['top']} ({share['max']:.1f}%)")
+    ]
+
+
+def _heatmap_rows(stats):
+    columns = stats['numeric'].values()
+    return [
+        ('Matrix Size', f"{stats['rows']}x{len(columns)}"),
+        ('Value Range', f"{min(c['min'] for c in columns):.3f} - {max(c['max'] for c in columns):.3f}"),
+        ('Average Correlation', f"{sum(c['sum'] for c in columns) / (stats['rows'] * len(columns)):.3f}")
+    ]
+
+
+def _scatter_3d_rows(stats):
+    return [
+        ('Data Points', f"{stats['rows']:,}"),
+        ('Color Categories', f"{stats['distinct']['color']}"),
+        ('Size Range', _value_range(stats['numeric']['size'], 1))
+    ]
+
+
+def _grouped_rows(group_column, label):
+    def rows(stats):
+        return [
+            (label, f"{stats['distinct'][group_column]}"),
+            ('Total Points', f"{stats['rows']:,}"),
+            ('Value Range', _value_range(stats['numeric']['value']))
+        ]
+    return rows
+
+
+def _histogram_rows(stats):
+    value = stats['numeric']['value']
+    return [
+        ('Data Points', f"{stats['rows']:,}"),
+        ('Value Range', _value_range(value)),
+        ('Mean', f"{value['mean']:.2f}"),
+        ('Std Dev', f"{value['std']:.2f}")
+    ]
+
+
+def _wordcloud_rows(stats):
+    return [
+        ('Unique Words', f"{stats['words']}"),
+        ('Max Frequency', f"{stats['max_frequency']:.0f}"),
+        ('Min Frequency', f"{stats['min_frequency']:.0f}")
+    ]
+
+
+def _map_rows(stats):
+    value = stats['numeric']['value']
+    return [
+        ('Locations', f"{stats['rows']:,}"),
+        ('Value Range', _value_range(value, 0)),
+        ('Top Location', value['top'])
+    ]
+
+
+def _gauge_rows(stats):
+    percentage = stats['numeric']['percentage']
+    return [
+        ('Metrics', f"{stats['rows']}"),
+        ('Average Usage', f"{percentage['mean']:.1f}%"),
+        ('Highest Usage', percentage['top'])
+    ]
+
+
+def _funnel_rows(stats):
+    return [
+        ('Stages', f"{stats['rows']}"),
+        ('Total Visitors', f"{stats['numeric']['value']['max']:,.0f}"),
+        ('Conversion Rate', f"{stats['numeric']['conversion_rate']['min']:.1f}%")
+    ]
+
+
+def _radar_rows(stats):
+    products = stats['numeric'].values()
+    return [
+        ('Categories', f"{stats['rows']}"),
+        ('Products', f"{len(products)}"),
+        ('Score Range', f"{min(p['min'] for p in products):.0f}-{max(p['max'] for p in products):.0f}")
+    ]
+
+
+def _default_rows(stats):
+    """Row count and numeric ranges, for chart types without their own summary"""
+    if 'rows' not in stats:
+        return []
+    rows = [('Data Points', f"{stats['rows']:,}")]
+    rows.extend((f"{column} Range", _value_range(column_stats)) for column, column_stats in stats['numeric'].items())
+    return rows
+
+
+# How each chart type presents the statistics of its dataset
+CHART_SUMMARIES = {
+    'Line Chart': _line_rows,
+    'Bar Chart': _bar_rows,
+    'Scatter Plot': _scatter_rows,
+    'Pie Chart': _pie_rows,
+    'Heatmap': _heatmap_rows,
+    '3D Scatter': _scatter_3d_rows,
+    'Area Chart': _area_rows,
+    'Box Plot': _grouped_rows('group', 'Groups'),
+    'Histogram': _histogram_rows,
+    'Violin Plot': _grouped_rows('category', 'Categories'),
+    'Word Cloud': _wordcloud_rows,
+    'Map': _map_rows,
+    'Gauge Chart': _gauge_rows,
+    'Funnel Chart': _funnel_rows,
+    'Radar Chart': _radar_rows
+}
+
+
+def chart_summary(viz_type, data_gen):
+    """(label, value) rows summarizing the dataset behind a chart type
+
+    Statistics come from data_gen.summarize(), which computes them once per
+    dataset and caches them with it. Returns an empty list for charts
+    without a dataset.
+    """
+    if viz_type not in chart_registry or chart_registry[viz_type].dataset is None:
+        return []
+    stats = data_gen.summarize(chart_registry[viz_type].dataset)
+    return CHART_SUMMARIES.get(viz_type, _default_rows)(stats)
@@ -1,3 +1,6 @@
+import functools
+from statistics import NormalDist
+
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
@@ -30,6 +33,25 @@ PLOTLY_COLORS = [
     '#5f27cd', '#00d2d3', '#ff9f43', '#10ac84'
 ]
 
+# Rows per block in the fused statistics pass; small enough that the few
+# reductions over a block are served from cache
+STATS_CHUNK_ROWS = 1 << 16
+
+# Quantiles calculate_statistics always reports, with their result keys
+DEFAULT_QUANTILES = {'q25': 0.25, 'median': 0.5, 'q75': 0.75}
+
+# Default cut-offs per outlier method: the whisker multiplier for 'iqr', and
+# the score above which a point is an outlier for the others
+OUTLIER_THRESHOLDS = {'iqr': 1.5, 'zscore': 3.0, 'modified_zscore': 3.5, 'rolling': 3.0}
+DEFAULT_ROLLING_WINDOW = 30
+
+# Confidence bands are reduced to about this many points per edge
+DEFAULT_BAND_POINTS = 2_000
+
+# Accuracy parameter of QuantileSketch: rank error is roughly 1.7 / k, and
+# the sketch keeps about 3k values however much data it has seen
+DEFAULT_SKETCH_K = 256
+
 class ThemeManager:
     """Manage dark theme styling across applications"""
     
@@ -76,46 +98,660 @@ class ThemeManager:
         )
         return fig
 
+class ColumnMoments:
+    """Statistics of one column, each computed on first use and then kept
+
+    mean/std/min/max come from one DataProcessor._moments pass, the
+    quartiles from one partition, and rolling windows are memoized per
+    window size, so methods that share a statistic never rescan the column.
+    The values are not copied; do not modify them while the object is in use.
+    """
+    
+    def __init__(self, values):
+        self.values = values
+        self._rolling = {}
+    
+    @functools.cached_property
+    def _basic(self):
+        count, mean, std, low, high = DataProcessor._moments(self.values[:, None])
+        return count[0], mean[0], std[0], low[0], high[0]
+    
+    @property
+    def count(self):
+        return int(self._basic[0])
+    
+    @property
+    def mean(self):
+        return self._basic[1]
+    
+    @property
+    def std(self):
+        return self._basic[2]
+    
+    @property
+    def min(self):
+        return self._basic[3]
+    
+    @property
+    def max(self):
+        return self._basic[4]
+    
+    @functools.cached_property
+    def present(self):
+        """The column without NaNs (the column itself when there are none)"""
+        return self.values if self.count == len(self.values) else self.values[~np.isnan(self.values)]
+    
+    @functools.cached_property
+    def quartiles(self):
+        """(q1, median, q3)"""
+        if not len(self.present):
+            return np.nan, np.nan, np.nan
+        return tuple(DataProcessor._partition_quantiles(self.present, [0.25, 0.5, 0.75]))
+    
+    @functools.cached_property
+    def mad(self):
+        """Median absolute deviation from the median"""
+        if not len(self.present):
+            return np.nan
+        return DataProcessor._partition_quantiles(np.abs(self.present - self.quartiles[1]), [0.5])[0]
+    
+    def rolling(self, window, center=False):
+        """Rolling (mean, std) over window rows
+
+        Trailing windows are NaN until the window is full. Centred windows
+        are aligned like pandas ``rolling(center=True)`` and shrink at both
+        ends of the column instead of leaving them empty. Windowed sums come
+        from differences of cumulative sums, so any window size costs O(n).
+        Values are centred on the column mean first to keep the
+        sum-of-squares difference from cancelling.
+        """
+        if (window, center) not in self._rolling:
+            rows = np.arange(len(self.values))
+            if center:
+                starts = np.maximum(rows - window // 2, 0)
+                ends = np.minimum(rows + (window - 1) // 2 + 1, len(rows))
+            else:
+                starts, ends = np.maximum(rows - window + 1, 0), rows + 1
+            valid = ~np.isnan(self.values)
+            shifted = np.where(valid, self.values - self.mean, 0.0)
+            sums = []
+            for series in (valid.astype(np.float64), shifted, shifted * shifted):
+                cumulative = np.concatenate([[0.0], np.cumsum(series)])
+                sums.append(cumulative[ends] - cumulative[starts])
+            n, s1, s2 = sums
+            if not center:
+                n[:window - 1] = np.nan
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = s1 / n + self.mean
+                std = np.sqrt(np.maximum(s2 - s1 * s1 / n, 0.0) / (n - 1))
+            self._rolling[window, center] = (mean, std)
+        return self._rolling[window, center]
+
+
 class DataProcessor:
     """Utility functions for data processing"""
     
     @staticmethod
-    def calculate_statistics(data, column):
-        """Calculate basic statistics for a data column"""
-        if isinstance(data, pd.DataFrame) and column in data.columns:
-            return {
+    def column_moments(data, column):
+        """ColumnMoments snapshot of a DataFrame column
+
+        Pass the result as ``moments`` to detect_outliers() to share
+        statistics between calls; build a new one after the frame changes.
+        """
+        return ColumnMoments(data[column].to_numpy(dtype=np.float64, copy=True))
+    
+    @staticmethod
+    def _moments(block, chunk_rows=STATS_CHUNK_ROWS):
+        """Count, mean, sample std, min and max of each column of a 2-D array
+
+        One pass over the rows in blocks: each block's moments are merged
+        into the running totals with Chan's parallel form of Welford's
+        update, which stays accurate where sum-of-squares formulas cancel.
+        NaNs are skipped.
+        """
+        k = block.shape[1]
+        count = np.zeros(k)
+        mean = np.zeros(k)
+        m2 = np.zeros(k)
+        low = np.full(k, np.inf)
+        high = np.full(k, -np.inf)
+        
+        for start in range(0, len(block), chunk_rows):
+            # Converted a block at a time, so narrower dtypes are never copied whole
+            chunk = np.asarray(block[start:start + chunk_rows], dtype=np.float64)
+            valid = ~np.isnan(chunk)
+            n = valid.sum(axis=0)
+            if not n.any():
+                continue
+            filled = np.where(valid, chunk, 0.0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                chunk_mean = filled.sum(axis=0) / n
+                chunk_m2 = (np.where(valid, chunk - chunk_mean, 0.0) ** 2).sum(axis=0)
+                total = count + n
+                delta = chunk_mean - mean
+                update = n > 0
+                mean = np.where(update, mean + delta * n / total, mean)
+                m2 = np.where(update, m2 + chunk_m2 + delta ** 2 * count * n / total, m2)
+            count = total
+            low = np.minimum(low, np.where(valid, chunk, np.inf).min(axis=0))
+            high = np.maximum(high, np.where(valid, chunk, -np.inf).max(axis=0))
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(m2 / (count - 1))
+        std[count < 2] = np.nan
+        missing = count == 0
+        mean[missing] = np.nan
+        low[missing] = np.nan
+        high[missing] = np.nan
+        return count, mean, std, low, high
+    
+    @staticmethod
+    def calculate_statistics(data, column, quantiles=None):
+        """Calculate basic statistics for one or more data columns
+
+        count/mean/std/min/max of numeric columns come from one blocked pass
+        over the columns and every quantile of a column from a single
+        partition. Other columns (e.g. datetimes) use pandas reductions, so
+        their statistics keep the column's type. Extra ``quantiles``
+        (probabilities) are reported as 'q<percent>'. With a list of
+        columns, returns a dict of per-column results.
+        """
+        columns = [column] if isinstance(column, str) else list(column)
+        if not isinstance(data, pd.DataFrame) or any(c not in data.columns for c in columns):
+            return None
+        
+        probabilities = dict(DEFAULT_QUANTILES)
+        for p in quantiles or ():
+            probabilities.setdefault(f'q{p * 100:g}', p)
+        
+        numeric = [c for c in columns if pd.api.types.is_numeric_dtype(data[c].dtype)]
+        block = data[numeric].to_numpy(dtype=np.float64, na_value=np.nan)
+        count, mean, std, low, high = DataProcessor._moments(block)
+        
+        results = {}
+        for i, name in enumerate(numeric):
+            values = block[:, i]
+            values = values[~np.isnan(values)] if count[i] < len(values) else values
+            if len(values):
+                qs = DataProcessor._partition_quantiles(values, list(probabilities.values()))
+            else:
+                qs = np.full(len(probabilities), np.nan)
+            qs = dict(zip(probabilities, qs))
+            results[name] = {
                 'count': len(data),
-                'mean': data[column].mean(),
-                'median': data[column].median(),
-                'std': data[column].std(),
-                'min': data[column].min(),
-                'max': data[column].max(),
-                'q25': data[column].quantile(0.25),
-                'q75': data[column].quantile(0.75)
+                'mean': mean[i],
+                'median': qs.pop('median'),
+                'std': std[i],
+                'min': low[i],
+                'max': high[i],
+                **qs
             }
-        return None
+        for name in columns:
+            if name not in results:
+                series = data[name]
+                qs = {key: series.quantile(p) for key, p in probabilities.items()}
+                results[name] = {
+                    'count': len(data),
+                    'mean': series.mean(),
+                    'median': qs.pop('median'),
+                    'std': series.std(),
+                    'min': series.min(),
+                    'max': series.max(),
+                    **qs
+                }
+        if isinstance(column, str):
+            return results[column]
+        return {name: results[name] for name in columns}
     
     @staticmethod
-    def detect_outliers(data, column, method='iqr'):
-        """Detect outliers in data using specified method"""
-        if method == 'iqr':
-            Q1 = data[column].quantile(0.25)
-            Q3 = data[column].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outliers = data[(data[column] < lower_bound) | (data[column] > upper_bound)]
-            return outliers
-        return pd.DataFrame()
+    def detect_outliers(data, column, method='iqr', return_indices=False, threshold=None,
+                        window=DEFAULT_ROLLING_WINDOW, moments=None):
+        """Detect outliers in data using specified method
+
+        Methods: 'iqr' (Tukey fences), 'zscore', 'modified_zscore' (median
+        and MAD based, robust to the outliers themselves) and 'rolling'
+        (z-score against a trailing window of ``window`` rows, for time
+        series). ``threshold`` overrides the method's default cut-off in
+        OUTLIER_THRESHOLDS. Pass ``moments`` from column_moments() to
+        reuse statistics across calls, e.g. when switching methods on the
+        same unchanged frame.
+
+        Returns the outlier rows, or with ``return_indices`` their row
+        positions, which avoids copying the frame. For chunked or
+        out-of-core data use StreamingOutlierDetector.
+        """
+        if method not in OUTLIER_THRESHOLDS:
+            raise ValueError(f"Unknown outlier method {method!r}; expected one of {list(OUTLIER_THRESHOLDS)}")
+        threshold = OUTLIER_THRESHOLDS[method] if threshold is None else threshold
+        if moments is None:
+            moments = ColumnMoments(data[column].to_numpy(dtype=np.float64))
+        values = moments.values
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if method == 'iqr':
+                Q1, _, Q3 = moments.quartiles
+                IQR = Q3 - Q1
+                mask = (values < Q1 - threshold * IQR) | (values > Q3 + threshold * IQR)
+            elif method == 'zscore':
+                mask = np.abs(values - moments.mean) > threshold * moments.std
+            elif method == 'modified_zscore':
+                # 0.6745 makes the MAD consistent with the std for normal data
+                mask = 0.6745 * np.abs(values - moments.quartiles[1]) > threshold * moments.mad
+            else:
+                mean, std = moments.rolling(window)
+                mask = np.abs(values - mean) > threshold * std
+        
+        return np.flatnonzero(mask) if return_indices else data[mask]
     
     @staticmethod
-    def normalize_data(data, column, method='minmax'):
-        """Normalize data using specified method"""
-        if method == 'minmax':
-            return (data[column] - data[column].min()) / (data[column].max() - data[column].min())
-        elif method == 'zscore':
-            return (data[column] - data[column].mean()) / data[column].std()
-        return data[column]
+    def normalize_data(data, column, method='minmax', out=None, dtype=np.float32, moments=None):
+        """Normalize data using specified method
+
+        ``column`` may be a list of columns, normalized together into one
+        (rows, columns) array. Results are written straight into ``out``
+        with ufunc ``out=`` semantics, so no temporaries the size of the
+        data are made; pass a preallocated float32 buffer (Fortran order
+        keeps each column contiguous) to bound peak memory. Without ``out``
+        a list of columns gets a new Fortran-ordered ``dtype`` array.
+        min/max and mean/std come from ``moments`` when given (a
+        ColumnMoments from column_moments(), or a mapping of column name to
+        one), so a column already scanned by detect_outliers() is not
+        scanned again. Other columns get one blocked _moments() pass at
+        their own dtype, so float32 columns are not widened first.
+
+        Returns a Series for a single column (float64 unless ``out`` is
+        given) and a DataFrame backed by the output array for a list.
+        """
+        single = isinstance(column, str)
+        columns = [column] if single else list(column)
+        if out is None:
+            out = np.empty((len(data), len(columns)), dtype=np.float64 if single else dtype, order='F')
+        target = out.reshape(len(data), len(columns)) if out.ndim == 1 else out
+        if isinstance(moments, ColumnMoments):
+            moments = {columns[0]: moments}
+        moments = moments or {}
+        if target.shape != (len(data), len(columns)):
+            raise ValueError(f"out has shape {out.shape}; expected {(len(data), len(columns))}")
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            for j, name in enumerate(columns):
+                values = data[name].to_numpy()
+                if values.dtype.kind not in 'fiu':
+                    values = data[name].to_numpy(dtype=np.float64, na_value=np.nan)
+                offset, scale = 0.0, 1.0
+                if method in ('minmax', 'zscore'):
+                    if name in moments:
+                        stats = moments[name]
+                        mean, std, low, high = stats.mean, stats.std, stats.min, stats.max
+                    else:
+                        _, mean, std, low, high = (m[0] for m in DataProcessor._moments(values[:, None]))
+                    offset, scale = (low, high - low) if method == 'minmax' else (mean, std)
+                np.subtract(values, offset, out=target[:, j], casting='same_kind')
+                if scale != 1.0:
+                    np.divide(target[:, j], scale, out=target[:, j])
+        
+        if single:
+            return pd.Series(target[:, 0], index=data.index, name=column, copy=False)
+        return pd.DataFrame(target, index=data.index, columns=columns, copy=False)
+    
+    @staticmethod
+    def _partition_quantiles(values, probabilities):
+        """Linear-interpolated quantiles of a 1-D array from a single partition"""
+        n = len(values)
+        pos = np.asarray(probabilities, dtype=np.float64) * (n - 1)
+        lower = np.floor(pos).astype(np.int64)
+        upper = np.minimum(lower + 1, n - 1)
+        part = np.partition(values, np.unique(np.concatenate([lower, upper])))
+        return part[lower] + (pos - lower) * (part[upper] - part[lower])
+    
+    @staticmethod
+    def grouped_box_stats(values, codes, n_groups, whisker=1.5):
+        """Quartiles, Tukey whiskers and outlier mask per group
+
+        ``codes`` are integer group labels in [0, n_groups). Rows are bucketed
+        by group with one stable integer sort, then each group needs a single
+        partition for its quartiles. Returns per-group arrays plus
+        ``outliers``, a boolean mask over the input values.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        codes = np.asarray(codes)
+        order = np.argsort(codes, kind='stable')
+        counts = np.bincount(codes, minlength=n_groups)
+        bounds = np.concatenate([[0], np.cumsum(counts)])
+        
+        stats = {name: np.full(n_groups, np.nan) for name in ('q1', 'median', 'q3', 'lowerfence', 'upperfence')}
+        stats['count'] = counts
+        outliers = np.zeros(len(values), dtype=bool)
+        for g in range(n_groups):
+            rows = order[bounds[g]:bounds[g + 1]]
+            if len(rows) == 0:
+                continue
+            group = values[rows]
+            q1, median, q3 = DataProcessor._partition_quantiles(group, [0.25, 0.5, 0.75])
+            low_limit = q1 - whisker * (q3 - q1)
+            high_limit = q3 + whisker * (q3 - q1)
+            outside = (group < low_limit) | (group > high_limit)
+            inside = group[~outside]
+            
+            stats['q1'][g], stats['median'][g], stats['q3'][g] = q1, median, q3
+            # Whiskers end at the most extreme values still inside the limits
+            stats['lowerfence'][g] = inside.min()
+            stats['upperfence'][g] = inside.max()
+            outliers[rows[outside]] = True
+        
+        stats['outliers'] = outliers
+        return stats
+    
+    @staticmethod
+    def kde_bandwidth(values):
+        """Kernel bandwidth by the rule Plotly.js uses for violins
+
+        Silverman's rule, 1.059 * min(std, IQR / 1.349) * n^-0.2, floored at
+        1% of the data span as Plotly.js does; 1.0 when all values are equal.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n = len(values)
+        if n == 0:
+            return 1.0
+        span = values.max() - values.min()
+        if not span:
+            return 1.0
+        q1, q3 = DataProcessor._partition_quantiles(values, [0.25, 0.75])
+        spread = min(np.std(values, ddof=1), (q3 - q1) / 1.349)
+        return max(1.059 * spread * n ** (-1 / 5), span / 100)
+    
+    @staticmethod
+    def kde_on_grid(values, grid, bandwidth=None):
+        """Gaussian kernel density of values evaluated on an evenly spaced grid
+
+        Values are linearly binned onto the grid and convolved with a sampled
+        kernel, so the cost is O(n + grid size * kernel width). A grid of
+        one repeated point gets the exact density at that point.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        grid = np.asarray(grid, dtype=np.float64)
+        n = len(values)
+        if n == 0 or len(grid) == 0:
+            return np.zeros_like(grid)
+        if bandwidth is None:
+            bandwidth = DataProcessor.kde_bandwidth(values)
+        
+        if len(grid) < 2 or not grid[1] > grid[0]:
+            point = np.exp(-0.5 * ((values - grid[0]) / bandwidth) ** 2).sum()
+            return np.full_like(grid, point / (n * bandwidth * np.sqrt(2 * np.pi)))
+        
+        step = grid[1] - grid[0]
+        pos = np.clip((values - grid[0]) / step, 0, len(grid) - 1)
+        lower = np.minimum(np.floor(pos).astype(np.int64), len(grid) - 2)
+        frac = pos - lower
+        weights = np.bincount(lower, weights=1 - frac, minlength=len(grid))
+        weights += np.bincount(lower + 1, weights=frac, minlength=len(grid))
+        
+        half_width = int(np.ceil(4 * bandwidth / step))
+        offsets = np.arange(-half_width, half_width + 1) * step
+        kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2) / (bandwidth * np.sqrt(2 * np.pi))
+        density = np.convolve(weights, kernel, mode='full')[half_width:half_width + len(grid)]
+        return density / n
+
+class Downsampler:
+    """Reduce long series to a target point count before sending them to the browser"""
+    
+    @staticmethod
+    def _as_numeric(x):
+        """View x values (numbers or datetimes) as float64 for geometry"""
+        x = np.asarray(x)
+        if np.issubdtype(x.dtype, np.datetime64):
+            return x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+        return x.astype(np.float64, copy=False)
+    
+    @staticmethod
+    def lttb(x, y, n_out):
+        """Largest-Triangle-Three-Buckets: indices of the n_out points that best keep the shape"""
+        n = len(y)
+        if n_out >= n or n_out < 3:
+            return np.arange(n)
+        
+        xs = Downsampler._as_numeric(x)
+        ys = np.asarray(y, dtype=np.float64)
+        
+        # Bucket boundaries for the n_out - 2 interior buckets; first and last points are kept
+        edges = np.floor(np.linspace(1, n - 1, n_out - 1)).astype(np.int64)
+        counts = np.diff(edges)
+        avg_x = np.add.reduceat(xs[:-1], edges[:-1])[:len(counts)] / counts
+        avg_y = np.add.reduceat(ys[:-1], edges[:-1])[:len(counts)] / counts
+        # Each bucket is scored against the average of the bucket after it
+        avg_x = np.append(avg_x[1:], xs[-1])
+        avg_y = np.append(avg_y[1:], ys[-1])
+        
+        selected = np.empty(n_out, dtype=np.int64)
+        selected[0], selected[-1] = 0, n - 1
+        a = 0
+        for i in range(n_out - 2):
+            start, end = edges[i], edges[i + 1]
+            area = np.abs(
+                (xs[a] - avg_x[i]) * (ys[start:end] - ys[a])
+                - (xs[a] - xs[start:end]) * (avg_y[i] - ys[a])
+            )
+            a = start + int(np.argmax(area))
+            selected[i + 1] = a
+        return selected
+    
+    @staticmethod
+    def minmax(y, n_out):
+        """Indices of the min and max of each bucket, about n_out points in total"""
+        n = len(y)
+        n_buckets = max(n_out // 2, 1)
+        if n_out >= n:
+            return np.arange(n)
+        
+        size = -(-n // n_buckets)
+        padded = np.full(size * n_buckets, np.nan)
+        padded[:n] = y
+        buckets = padded.reshape(n_buckets, size)
+        offsets = np.arange(n_buckets) * size
+        valid = ~np.isnan(buckets).all(axis=1)
+        lows = np.nanargmin(buckets[valid], axis=1) + offsets[valid]
+        highs = np.nanargmax(buckets[valid], axis=1) + offsets[valid]
+        return np.unique(np.concatenate([[0, n - 1], lows, highs]))
+    
+    @staticmethod
+    def downsample_frame(data, x, y_columns, n_out, method='lttb'):
+        """Downsample a frame on one or more y columns, keeping rows picked for any of them"""
+        if len(data) <= n_out:
+            return data
+        if isinstance(y_columns, str):
+            y_columns = [y_columns]
+        per_column = max(n_out // len(y_columns), 3)
+        
+        picks = []
+        for column in y_columns:
+            if method == 'minmax':
+                picks.append(Downsampler.minmax(data[column].to_numpy(), per_column))
+            else:
+                picks.append(Downsampler.lttb(data[x].to_numpy(), data[column].to_numpy(), per_column))
+        return data.iloc[np.unique(np.concatenate(picks))]
+    
+    @staticmethod
+    def envelope(x, lower, upper, n_out):
+        """Reduce a band to about n_out buckets: min of lower and max of upper per bucket
+
+        The x of each bucket is the x of its middle row, so the reduced band
+        still covers every original point. NaNs are ignored.
+        """
+        n = len(x)
+        x = np.asarray(x)
+        if n_out >= n:
+            return x, np.asarray(lower, dtype=np.float64), np.asarray(upper, dtype=np.float64)
+        edges = np.floor(np.linspace(0, n, n_out + 1)).astype(np.int64)[:-1]
+        middles = (edges + np.append(edges[1:], n)) // 2
+        with np.errstate(invalid='ignore'):
+            lows = np.fmin.reduceat(np.asarray(lower, dtype=np.float64), edges)
+            highs = np.fmax.reduceat(np.asarray(upper, dtype=np.float64), edges)
+        return x[middles], lows, highs
+
+class StreamingHistogram:
+    """Fixed-bin histogram that accumulates counts over chunks of a stream"""
+    
+    def __init__(self, bins, value_range):
+        self.edges = np.linspace(value_range[0], value_range[1], bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+    
+    def update(self, values):
+        """Add a chunk of values; out-of-range values are tallied separately"""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        low, high = self.edges[0], self.edges[-1]
+        below = values < low
+        above = values > high
+        self.underflow += int(np.count_nonzero(below))
+        self.overflow += int(np.count_nonzero(above))
+        
+        inside = values[~(below | above)]
+        bins = len(self.counts)
+        idx = ((inside - low) * (bins / (high - low))).astype(np.int64)
+        np.minimum(idx, bins - 1, out=idx)  # the top edge belongs to the last bin
+        self.counts += np.bincount(idx, minlength=bins)
+        return self
+    
+    def merge(self, other):
+        """Combine counts from another histogram with the same edges"""
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Cannot merge histograms with different bin edges")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+class QuantileSketch:
+    """Mergeable approximate quantiles over a stream (KLL sketch)
+
+    Values are kept in a stack of compactors; an item at level h stands for
+    2**h inputs. When a level outgrows its capacity it is sorted and every
+    other item (from a random offset) is promoted, so memory stays around
+    3k values regardless of stream length. Sketches built on separate
+    chunks or in worker processes (they pickle) can be merged.
+    """
+    
+    def __init__(self, k=DEFAULT_SKETCH_K, seed=None):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._rng = np.random.default_rng(seed)
+    
+    def _capacity(self, level):
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+    
+    def _compress(self):
+        # Lazy compaction: only compact while the sketch as a whole is over
+        # budget, always at the lowest overfull level, which keeps more items
+        # (and so more accuracy) than compacting every overfull level
+        while sum(len(items) for items in self.levels) > sum(map(self._capacity, range(len(self.levels)))):
+            level = next(h for h, items in enumerate(self.levels) if len(items) > self._capacity(h))
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(self.levels[level])
+            # An odd item out stays behind so the promoted weight is exact
+            even = len(items) - len(items) % 2
+            promoted = items[:even][self._rng.integers(2)::2]
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            self.levels[level] = items[even:]
+    
+    def update(self, values):
+        """Add a chunk of values (NaNs are ignored)"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.count += len(values)
+            self.min = min(self.min, values.min())
+            self.max = max(self.max, values.max())
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+    
+    def merge(self, other):
+        """Fold another sketch into this one"""
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress()
+        return self
+    
+    def quantiles(self, probabilities):
+        """Approximate quantiles for an array of probabilities in [0, 1]"""
+        probabilities = np.asarray(probabilities, dtype=np.float64)
+        if not self.count:
+            return np.full(probabilities.shape, np.nan)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(l), 2.0 ** h) for h, l in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        items = items[order]
+        cumulative = np.cumsum(weights[order])
+        idx = np.searchsorted(cumulative, probabilities * cumulative[-1], side='left')
+        result = items[np.minimum(idx, len(items) - 1)]
+        # The extremes are tracked exactly
+        result = np.where(probabilities <= 0, self.min, result)
+        return np.where(probabilities >= 1, self.max, result)
+    
+    def quantile(self, probability):
+        return float(self.quantiles([probability])[0])
+
+
+class StreamingOutlierDetector:
+    """IQR outlier detection over chunks, with bounds from a QuantileSketch
+
+    Feed every chunk to update() (or merge detectors built in parallel),
+    then make a second pass with outlier_indices() to get the global row
+    positions of outliers without materializing any filtered frames.
+    """
+    
+    def __init__(self, column=None, whisker=1.5, k=DEFAULT_SKETCH_K, seed=None):
+        self.column = column
+        self.whisker = whisker
+        self.sketch = QuantileSketch(k, seed)
+    
+    def _values(self, chunk):
+        if isinstance(chunk, pd.DataFrame):
+            chunk = chunk[self.column]
+        return np.asarray(chunk, dtype=np.float64)
+    
+    def update(self, chunk):
+        self.sketch.update(self._values(chunk))
+        return self
+    
+    def fit(self, chunks):
+        """Sketch every chunk of an iterable"""
+        for chunk in chunks:
+            self.update(chunk)
+        return self
+    
+    def merge(self, other):
+        self.sketch.merge(other.sketch)
+        return self
+    
+    def bounds(self):
+        """(lower, upper) Tukey fences from the sketched quartiles"""
+        q1, q3 = self.sketch.quantiles([0.25, 0.75])
+        iqr = q3 - q1
+        return q1 - self.whisker * iqr, q3 + self.whisker * iqr
+    
+    def outlier_indices(self, chunks, offset=0):
+        """Row positions of outliers across an iterable of chunks, counted from offset"""
+        lower, upper = self.bounds()
+        found = []
+        for chunk in chunks:
+            values = self._values(chunk)
+            found.append(np.flatnonzero((values < lower) | (values > upper)) + offset)
+            offset += len(values)
+        return np.concatenate(found) if found else np.empty(0, dtype=np.int64)
 
 class ChartEnhancer:
     """Enhance charts with additional features"""
@@ -151,34 +787,48 @@ class ChartEnhancer:
         return fig
     
     @staticmethod
-    def add_confidence_interval(fig, x, y, confidence=0.95):
-        """Add confidence interval to line plot"""
-        # Simple confidence interval calculation
-        mean_y = np.mean(y)
-        std_y = np.std(y)
-        z_score = 1.96  # 95% confidence interval
+    def add_confidence_interval(fig, x, y, confidence=0.95, window=DEFAULT_ROLLING_WINDOW,
+                                max_points=DEFAULT_BAND_POINTS):
+        """Add a rolling confidence band to line plot
+
+        The band is the centred rolling mean of y plus or minus z rolling
+        standard deviations over ``window`` points, with z taken from
+        ``confidence``. Windows are aligned like pandas
+        ``rolling(center=True)`` and shrink at the ends of the series, so
+        series shorter than the window still get a band. Rolling moments
+        come from cumulative sums in O(n) (ColumnMoments.rolling), and the
+        band is reduced to about ``max_points`` points per edge by bucket
+        envelope, so it stays cheap for very long series.
+        """
+        y = np.asarray(y, dtype=np.float64)
+        window = max(2, min(window, len(y)))
+        z_score = NormalDist().inv_cdf(0.5 + confidence / 2)
+        center_mean, center_std = ColumnMoments(y).rolling(window, center=True)
         
-        upper_bound = mean_y + z_score * std_y
-        lower_bound = mean_y - z_score * std_y
+        band_x, lower_bound, upper_bound = Downsampler.envelope(
+            x, center_mean - z_score * center_std, center_mean + z_score * center_std, max_points
+        )
         
+        # The upper edge is drawn first and the lower edge fills up to it
         fig.add_trace(go.Scatter(
-            x=x,
+            x=band_x,
             y=upper_bound,
             mode='lines',
             line=dict(width=0),
             showlegend=False,
-            fillcolor=DARK_THEME['primary'],
-            fill='tonexty'
+            hoverinfo='skip'
         ))
         
         fig.add_trace(go.Scatter(
-            x=x,
+            x=band_x,
             y=lower_bound,
             mode='lines',
             line=dict(width=0),
-            fillcolor=DARK_THEME['primary'],
+            fillcolor='rgba(0, 255, 136, 0.2)',
             fill='tonexty',
-            showlegend=False
+            name=f'{confidence:.0%} band',
+            showlegend=False,
+            hoverinfo='skip'
         ))
         
         return fig
@@ -266,6 +916,7 @@ class PerformanceMonitor:
 # Global instances
 theme_manager = ThemeManager()
 data_processor = DataProcessor()
+downsampler = Downsampler()
 chart_enhancer = ChartEnhancer()
 export_manager = ExportManager()
 performance_monitor = PerformanceMonitor() 
\ No newline at end of file
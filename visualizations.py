@@ -1,16 +1,19 @@
+import functools
+import inspect
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express as px
-import plotly.figure_factory as ff
 from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
 import pandas as pd
 import numpy as np
-from wordcloud import WordCloud
-import folium
-import altair as alt
-import streamlit as st
-from data_generator import data_gen
+from data_generator import data_gen, DEFAULT_CHUNK_ROWS
+from cache import LRUCache, fingerprint
+from figure_updates import FigurePatcher
+from registry import chart_registry
+from utils import data_processor, downsampler, StreamingHistogram
 
 # Dark theme colors
 DARK_COLORS = {
@@ -26,11 +29,215 @@ DARK_COLORS = {
 
 PLOTLY_COLORS = ['#00ff88', '#ff6b6b', '#4ecdc4', '#45b7d1', '#96ceb4', '#feca57', '#ff9ff3', '#54a0ff']
 
+# Memory cap for figures kept by the figure cache (measured as JSON length)
+FIGURE_CACHE_ENTRIES = 128
+FIGURE_CACHE_BYTES = 64 * 1024 * 1024
+
+# Time series longer than this many points per chart pixel are downsampled
+DEFAULT_CHART_WIDTH = 1200
+
+# Point-count thresholds for switching scatter traces to WebGL, and for
+# aggregating them server-side into a density raster
+WEBGL_THRESHOLD = 10_000
+RASTER_THRESHOLD = 1_000_000
+RASTER_SHAPE = (600, 300)
+
+# Histograms with more samples than this are binned server-side
+SERVER_BINNING_THRESHOLD = 10_000
+
+# Box and violin plots with more samples than this are summarized server-side
+SERVER_SUMMARY_THRESHOLD = 10_000
+MAX_OUTLIER_POINTS = 5_000
+KDE_GRID_POINTS = 256
+
+# Rendered word clouds are written here and served as static files: Streamlit
+# serves ./static at app/static (server.enableStaticServing), Gradio serves
+# allowed paths under /file=
+WORDCLOUD_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'wordclouds')
+WORDCLOUD_URL_PREFIX = 'app/static/wordclouds'
+# Rendered PNGs kept on disk; the least recently used are deleted beyond this
+WORDCLOUD_MAX_FILES = 32
+
+# Map build path by location count: per-feature GeoJSON up to MAP_GEOJSON_LIMIT,
+# client-side clustering up to MAP_CLUSTER_LIMIT, a pydeck WebGL layer beyond
+MAP_GEOJSON_LIMIT = 1_000
+MAP_CLUSTER_LIMIT = 100_000
+
+# Styled circle markers for FastMarkerCluster; rows are [lat, lon, value, label]
+FAST_CLUSTER_CALLBACK = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: row[2] / 10, color: '%s', fill: true, fillColor: '%s'
+    });
+    marker.bindPopup(row[3]);
+    return marker;
+}
+""" % (DARK_COLORS['primary'], DARK_COLORS['accent'])
+
+
+def figure_spec(fig):
+    """Figure as a plain dict, without the expanded default template
+
+    go.Figure() re-applies the default template when rebuilding, and leaving
+    the template out is what makes the rebuild cheaper than validating it.
+    """
+    spec = fig.to_dict()
+    spec['layout'].pop('template', None)
+    return spec
+
+
+def _option_key(name, value):
+    """Hashable, canonical form of a chart option for the figure cache key
+
+    Lists (which is what tuples become after a JSON round trip through the
+    data service) and dicts are turned into tuples, and x_range bounds into
+    Timestamps so equal ranges given as strings or dates share an entry.
+    """
+    if name == 'x_range' and value is not None:
+        return tuple(pd.Timestamp(bound) for bound in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_option_key(None, item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _option_key(None, v)) for k, v in value.items()))
+    return value
+
+
+def cached_figure(generator, data_params=()):
+    """Cache a Plotly figure on the fingerprint of its dataset and the theme
+
+    The decorated method receives the dataset produced by ``generator`` (a
+    DataGenerator method name) as its first argument; arguments named in
+    ``data_params`` are also passed on to the generator. Figures are stored
+    as dicts (see figure_spec) and a new go.Figure is built from the dict
+    on each hit, so callers can modify what they get back. The stored JSON
+    of the dict is available as ``method.to_json(self, ...)``, which serves
+    hits without building a figure at all.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def lookup(self, args, kwargs):
+            """(spec, JSON) cache entry, and the figure if it was just built"""
+            bound = signature.bind(self, None, *args, **kwargs)
+            bound.apply_defaults()
+            options = {k: v for k, v in list(bound.arguments.items())[2:]}
+            data = getattr(self.data_gen, generator)(**{k: options[k] for k in data_params})
+            key = (func.__name__, fingerprint(data), self.theme_key(),
+                   tuple((k, _option_key(k, v)) for k, v in options.items()))
+            cached = self.figure_cache.get(key)
+            if cached is not None:
+                return cached, None
+            fig = func(self, data, **options)
+            spec = figure_spec(fig)
+            return self.figure_cache.put(key, (spec, pio.to_json(spec, validate=False))), fig
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            entry, fig = lookup(self, args, kwargs)
+            return fig if fig is not None else go.Figure(entry[0], skip_invalid=True)
+
+        def to_json(self, *args, **kwargs):
+            return lookup(self, args, kwargs)[0][1]
+
+        wrapper.to_json = to_json
+        return wrapper
+    return decorator
+
+
+class WordCloudRenderer:
+    """Render word cloud PNGs in a background thread, cached on disk as static files"""
+    
+    def __init__(self, static_dir=WORDCLOUD_DIR, url_prefix=WORDCLOUD_URL_PREFIX, max_files=WORDCLOUD_MAX_FILES):
+        self.static_dir = static_dir
+        self.url_prefix = url_prefix
+        self.max_files = max_files
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='wordcloud')
+        self._jobs = {}
+        self._lock = threading.Lock()
+    
+    def key(self, words, width, height):
+        """Cache key for a frequency dict rendered at the given size"""
+        return fingerprint({
+            'words': words, 'width': width, 'height': height,
+            'background': DARK_COLORS['background'], 'colormap': 'viridis'
+        })
+    
+    def path(self, key):
+        return os.path.join(self.static_dir, f'{key}.png')
+    
+    def url(self, key):
+        return f'{self.url_prefix}/{key}.png'
+    
+    def submit(self, words, width, height):
+        """Return a future for the rendered key, starting a render if needed"""
+        key = self.key(words, width, height)
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.done():
+                return job
+            if os.path.exists(self.path(key)):
+                # Reuse marks the file as recently used for eviction
+                os.utime(self.path(key))
+                job = Future()
+                job.set_result(key)
+            else:
+                job = self._executor.submit(self._render, key, dict(words), width, height)
+            self._jobs[key] = job
+            return job
+    
+    def _evict(self):
+        """Delete the least recently used PNGs beyond max_files (call with the lock held)"""
+        files = [entry for entry in os.scandir(self.static_dir) if entry.name.endswith('.png')]
+        if len(files) <= self.max_files:
+            return
+        files.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:len(files) - self.max_files]:
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+            self._jobs.pop(entry.name[:-len('.png')], None)
+    
+    def _render(self, key, words, width, height):
+        from wordcloud import WordCloud
+        
+        image = WordCloud(
+            width=width, height=height,
+            background_color=DARK_COLORS['background'],
+            colormap='viridis',
+            max_words=50
+        ).generate_from_frequencies(words).to_image()
+        
+        # Write atomically so a concurrent request never serves a partial file
+        os.makedirs(self.static_dir, exist_ok=True)
+        tmp_path = f'{self.path(key)}.{threading.get_ident()}.tmp'
+        image.save(tmp_path, format='PNG')
+        with self._lock:
+            os.replace(tmp_path, self.path(key))
+            self._evict()
+        return key
+
+
 class VisualizationGenerator:
-    def __init__(self):
+    def __init__(self, figure_cache_entries=FIGURE_CACHE_ENTRIES, figure_cache_bytes=FIGURE_CACHE_BYTES,
+                 webgl_threshold=WEBGL_THRESHOLD, raster_threshold=RASTER_THRESHOLD):
         self.data_gen = data_gen
+        self.webgl_threshold = webgl_threshold
+        self.raster_threshold = raster_threshold
+        self.figure_cache = LRUCache(
+            max_entries=figure_cache_entries, max_bytes=figure_cache_bytes, sizeof=lambda entry: len(entry[1])
+        )
+        self.wordclouds = WordCloudRenderer()
+        self.patcher = FigurePatcher()
+        self._dispatch = None
+        self._dispatch_version = None
         self.setup_plotly_theme()
-        self.setup_matplotlib_theme()
+        # Applied by setup_matplotlib_theme() on first use
+        self.matplotlib_themed = False
+    
+    def theme_key(self):
+        """Fingerprint of the active colour theme, part of every figure cache key"""
+        return fingerprint({'dark': DARK_COLORS, 'palette': PLOTLY_COLORS})
     
     def setup_plotly_theme(self):
         """Setup Plotly dark theme"""
@@ -55,19 +262,49 @@ class VisualizationGenerator:
         return fig
     
     def setup_matplotlib_theme(self):
-        """Setup Matplotlib dark theme"""
+        """Setup Matplotlib dark theme
+
+        Importing matplotlib and seaborn is slow and only Matplotlib-based
+        charts need them, so call this before drawing one rather than at
+        start-up.
+        """
+        if self.matplotlib_themed:
+            return
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         plt.style.use('dark_background')
         sns.set_theme(style="darkgrid")
+        self.matplotlib_themed = True
+    
+    def _visible_series(self, data, y_columns, width, x_range, method):
+        """Clip a time series frame to x_range and downsample it to about one point per pixel
+
+        Returns the visible rows and whether any were dropped by downsampling.
+        """
+        if x_range is not None:
+            start, end = pd.Timestamp(x_range[0]), pd.Timestamp(x_range[1])
+            data = data[(data['date'] >= start) & (data['date'] <= end)]
+        if method is None:
+            return data, False
+        visible = downsampler.downsample_frame(data, 'date', y_columns, width or DEFAULT_CHART_WIDTH, method)
+        return visible, len(visible) < len(data)
     
-    def create_line_chart(self):
-        """1. Line Chart - Time series data trends"""
-        data = self.data_gen.generate_time_series_data()
+    @cached_figure('generate_time_series_data', data_params=('days',))
+    def create_line_chart(self, data, days=365, width=None, x_range=None, downsample='lttb'):
+        """1. Line Chart - Time series data trends
+
+        Series longer than ``width`` points are downsampled server-side.
+        Pass the zoomed ``x_range`` to re-fetch that window at full resolution.
+        """
+        visible, downsampled = self._visible_series(data, 'value', width, x_range, downsample)
+        trace = go.Scattergl if len(visible) > self.webgl_threshold else go.Scatter
         
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=data['date'],
-            y=data['value'],
-            mode='lines+markers',
+        fig.add_trace(trace(
+            x=visible['date'],
+            y=visible['value'],
+            mode='lines' if downsampled else 'lines+markers',
             name='Value',
             line=dict(color=DARK_COLORS['primary'], width=3),
             marker=dict(size=6)
@@ -87,10 +324,34 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_bar_chart(self):
-        """2. Bar Chart - Categorical data comparison"""
-        data = self.data_gen.generate_categorical_data()
+    def create_live_line_chart(self, times, values):
+        """Line chart for the live streaming mode (see streaming.LiveWindow)"""
+        trace = go.Scattergl if len(values) > self.webgl_threshold else go.Scatter
+        
+        fig = go.Figure()
+        fig.add_trace(trace(
+            x=times,
+            y=values,
+            mode='lines',
+            name='Live Value',
+            line=dict(color=DARK_COLORS['primary'], width=2)
+        ))
+        
+        fig.update_layout(
+            title='Live Time Series',
+            xaxis_title='Time',
+            yaxis_title='Value',
+            hovermode='x unified',
+            showlegend=True,
+            height=400,
+            uirevision='live'
+        )
         
+        return self.apply_dark_theme(fig)
+    
+    @cached_figure('generate_categorical_data')
+    def create_bar_chart(self, data):
+        """2. Bar Chart - Categorical data comparison"""
         fig = go.Figure(data=[
             go.Bar(
                 x=data['category'],
@@ -113,17 +374,42 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_scatter_plot(self):
-        """3. Scatter Plot - Correlation analysis"""
-        data = self.data_gen.generate_scatter_data()
-        
-        fig = px.scatter(
-            data, x='x', y='y', 
-            color='category',
-            size='size',
-            title='Correlation Analysis',
-            color_discrete_sequence=PLOTLY_COLORS
-        )
+    def _density_raster(self, x, y, title, shape=RASTER_SHAPE):
+        """Aggregate points into a 2D count grid and draw it as a heatmap image"""
+        counts, x_edges, y_edges = np.histogram2d(x, y, bins=shape)
+        # Log scale keeps sparse regions visible next to dense cores
+        density = np.round(np.where(counts > 0, np.log1p(counts), np.nan).T, 3)
+        
+        fig = go.Figure(go.Heatmap(
+            z=density,
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            colorscale='Viridis',
+            colorbar=dict(title='log(1 + count)'),
+            hoverongaps=False
+        ))
+        fig.update_layout(title=title)
+        return fig
+    
+    @cached_figure('generate_scatter_data', data_params=('n_points',))
+    def create_scatter_plot(self, data, n_points=500):
+        """3. Scatter Plot - Correlation analysis
+
+        Above ``webgl_threshold`` points the markers are drawn with WebGL;
+        above ``raster_threshold`` the points are binned server-side and
+        sent as a density raster instead.
+        """
+        if len(data) > self.raster_threshold:
+            fig = self._density_raster(data['x'].to_numpy(), data['y'].to_numpy(), 'Correlation Analysis (density)')
+        else:
+            fig = px.scatter(
+                data, x='x', y='y', 
+                color='category',
+                size='size',
+                title='Correlation Analysis',
+                color_discrete_sequence=PLOTLY_COLORS,
+                render_mode='webgl' if len(data) > self.webgl_threshold else 'svg'
+            )
         
         fig.update_layout(
             xaxis_title='X Variable',
@@ -133,10 +419,9 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_pie_chart(self):
+    @cached_figure('generate_pie_data')
+    def create_pie_chart(self, data):
         """4. Pie Chart - Distribution visualization"""
-        data = self.data_gen.generate_pie_data()
-        
         fig = go.Figure(data=[go.Pie(
             labels=data['category'],
             values=data['value'],
@@ -151,10 +436,9 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_heatmap(self):
+    @cached_figure('generate_heatmap_data')
+    def create_heatmap(self, data):
         """5. Heatmap - Matrix data representation"""
-        data = self.data_gen.generate_heatmap_data()
-        
         fig = go.Figure(data=go.Heatmap(
             z=data.values,
             x=data.columns,
@@ -170,10 +454,9 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_3d_scatter(self):
+    @cached_figure('generate_3d_scatter_data')
+    def create_3d_scatter(self, data):
         """6. 3D Scatter Plot - Multi-dimensional data"""
-        data = self.data_gen.generate_3d_scatter_data()
-        
         fig = go.Figure(data=[go.Scatter3d(
             x=data['x'],
             y=data['y'],
@@ -198,9 +481,14 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_area_chart(self):
-        """7. Area Chart - Cumulative data trends"""
-        data = self.data_gen.generate_area_data()
+    @cached_figure('generate_area_data', data_params=('days',))
+    def create_area_chart(self, data, days=90, width=None, x_range=None, downsample='lttb'):
+        """7. Area Chart - Cumulative data trends
+
+        Downsampling keeps the union of points picked for each series so the
+        stacked fills share x values.
+        """
+        data, _ = self._visible_series(data, ['revenue', 'costs', 'profit'], width, x_range, downsample)
         
         fig = go.Figure()
         
@@ -231,15 +519,62 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_box_plot(self):
-        """8. Box Plot - Statistical distribution"""
-        data = self.data_gen.generate_boxplot_data()
+    def _use_server_summary(self, data, summary):
+        return summary == 'server' or (summary == 'auto' and len(data) > SERVER_SUMMARY_THRESHOLD)
+    
+    def _group_codes(self, column):
+        """Integer codes and labels for a grouping column"""
+        categorical = pd.Categorical(column)
+        return categorical.codes, list(categorical.categories)
+    
+    def _precomputed_box_plot(self, data):
+        """Box plot from server-side quartiles, whiskers and (capped) outliers"""
+        codes, groups = self._group_codes(data['group'])
+        values = data['value'].to_numpy()
+        stats = data_processor.grouped_box_stats(values, codes, len(groups))
+        
+        fig = go.Figure(go.Box(
+            x=groups,
+            q1=stats['q1'],
+            median=stats['median'],
+            q3=stats['q3'],
+            lowerfence=stats['lowerfence'],
+            upperfence=stats['upperfence'],
+            marker_color=PLOTLY_COLORS[0],
+            name='value',
+            showlegend=False
+        ))
         
-        fig = px.box(
-            data, x='group', y='value',
-            title='Statistical Distribution by Group',
-            color_discrete_sequence=PLOTLY_COLORS
-        )
+        outliers = np.flatnonzero(stats['outliers'])
+        if len(outliers) > MAX_OUTLIER_POINTS:
+            outliers = outliers[::-(-len(outliers) // MAX_OUTLIER_POINTS)]
+        fig.add_trace(go.Scatter(
+            x=np.asarray(groups, dtype=object)[codes[outliers]],
+            y=values[outliers],
+            mode='markers',
+            marker=dict(color=PLOTLY_COLORS[0], size=4),
+            name='outliers',
+            showlegend=False
+        ))
+        fig.update_layout(title='Statistical Distribution by Group')
+        return fig
+    
+    @cached_figure('generate_boxplot_data', data_params=('n_samples',))
+    def create_box_plot(self, data, n_samples=None, summary='auto'):
+        """8. Box Plot - Statistical distribution
+
+        ``summary='server'`` computes quartiles, whiskers and outliers with
+        NumPy and sends only that geometry; ``'auto'`` does so above
+        SERVER_SUMMARY_THRESHOLD samples.
+        """
+        if self._use_server_summary(data, summary):
+            fig = self._precomputed_box_plot(data)
+        else:
+            fig = px.box(
+                data, x='group', y='value',
+                title='Statistical Distribution by Group',
+                color_discrete_sequence=PLOTLY_COLORS
+            )
         
         fig.update_layout(
             xaxis_title='Group',
@@ -249,16 +584,36 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_histogram(self):
-        """9. Histogram - Frequency distribution"""
-        data = self.data_gen.generate_histogram_data()
-        
-        fig = go.Figure(data=[go.Histogram(
-            x=data['value'],
-            nbinsx=30,
+    def _binned_histogram(self, edges, counts):
+        """Draw precomputed histogram bins as a bar chart"""
+        fig = go.Figure(data=[go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
             marker_color=DARK_COLORS['primary'],
             opacity=0.8
         )])
+        fig.update_layout(bargap=0)
+        return fig
+    
+    @cached_figure('generate_histogram_data', data_params=('n_samples',))
+    def create_histogram(self, data, n_samples=1000, bins=30, binning='auto'):
+        """9. Histogram - Frequency distribution
+
+        ``binning='server'`` computes the bins with NumPy and sends only
+        edges and counts; ``'auto'`` does so above SERVER_BINNING_THRESHOLD
+        samples and otherwise lets the browser bin the raw values.
+        """
+        if binning == 'server' or (binning == 'auto' and len(data) > SERVER_BINNING_THRESHOLD):
+            counts, edges = np.histogram(data['value'].to_numpy(), bins=bins)
+            fig = self._binned_histogram(edges, counts)
+        else:
+            fig = go.Figure(data=[go.Histogram(
+                x=data['value'],
+                nbinsx=bins,
+                marker_color=DARK_COLORS['primary'],
+                opacity=0.8
+            )])
         
         fig.update_layout(
             title='Frequency Distribution',
@@ -269,15 +624,88 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_violin_plot(self):
-        """10. Violin Plot - Density distribution"""
-        data = self.data_gen.generate_violin_data()
+    def create_streaming_histogram(self, n_samples, bins=30, value_range=(0, 160), chunk_size=DEFAULT_CHUNK_ROWS):
+        """Histogram of a scale-mode dataset, binned chunk by chunk without materializing it"""
+        histogram = StreamingHistogram(bins, value_range)
+        for chunk in self.data_gen.iter_dataset('histogram', n_samples, chunk_size):
+            histogram.update(chunk['value'].to_numpy())
+        
+        fig = self._binned_histogram(histogram.edges, histogram.counts)
+        fig.update_layout(
+            title='Frequency Distribution',
+            xaxis_title='Value',
+            yaxis_title='Frequency',
+            height=400
+        )
+        if histogram.underflow or histogram.overflow:
+            fig.add_annotation(
+                text=f"{histogram.underflow:,} below / {histogram.overflow:,} above range",
+                xref='paper', yref='paper', x=1, y=1, showarrow=False
+            )
         
-        fig = px.violin(
-            data, x='category', y='value',
+        return fig
+    
+    def _precomputed_violin_plot(self, data):
+        """Violin outlines from a server-side KDE on a fixed grid, plus median and quartile marks"""
+        codes, categories = self._group_codes(data['category'])
+        values = data['value'].to_numpy()
+        stats = data_processor.grouped_box_stats(values, codes, len(categories))
+        
+        fig = go.Figure()
+        for i, category in enumerate(categories):
+            group = values[codes == i]
+            if len(group) == 0:
+                continue
+            # Same bandwidth and 'soft' span (two bandwidths past the data)
+            # as Plotly.js, so the outline matches the client-side violin
+            bandwidth = data_processor.kde_bandwidth(group)
+            grid = np.linspace(group.min() - 2 * bandwidth, group.max() + 2 * bandwidth, KDE_GRID_POINTS)
+            density = data_processor.kde_on_grid(group, grid, bandwidth)
+            half_width = 0.4 * density / density.max()
+            
+            fig.add_trace(go.Scatter(
+                x=np.concatenate([i - half_width, (i + half_width)[::-1]]),
+                y=np.concatenate([grid, grid[::-1]]),
+                fill='toself',
+                mode='lines',
+                line=dict(color=PLOTLY_COLORS[0], width=1),
+                name=category,
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+            fig.add_trace(go.Scatter(
+                x=[i, i, i],
+                y=[stats['q1'][i], stats['median'][i], stats['q3'][i]],
+                mode='lines+markers',
+                line=dict(color=DARK_COLORS['text'], width=2),
+                marker=dict(symbol=['line-ew-open', 'circle', 'line-ew-open'], size=8),
+                name=category,
+                showlegend=False,
+                hovertemplate='%{y:.2f}<extra>' + category + '</extra>'
+            ))
+        
+        fig.update_layout(
             title='Density Distribution by Category',
-            color_discrete_sequence=PLOTLY_COLORS
+            xaxis=dict(tickmode='array', tickvals=list(range(len(categories))), ticktext=categories)
         )
+        return fig
+    
+    @cached_figure('generate_violin_data', data_params=('n_samples',))
+    def create_violin_plot(self, data, n_samples=None, summary='auto'):
+        """10. Violin Plot - Density distribution
+
+        ``summary='server'`` evaluates each category's KDE on a fixed grid
+        with NumPy and sends only the outlines; ``'auto'`` does so above
+        SERVER_SUMMARY_THRESHOLD samples.
+        """
+        if self._use_server_summary(data, summary):
+            fig = self._precomputed_violin_plot(data)
+        else:
+            fig = px.violin(
+                data, x='category', y='value',
+                title='Density Distribution by Category',
+                color_discrete_sequence=PLOTLY_COLORS
+            )
         
         fig.update_layout(
             xaxis_title='Category',
@@ -287,40 +715,44 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_wordcloud(self):
-        """11. Word Cloud - Text data visualization"""
-        words = self.data_gen.generate_wordcloud_data()
-        
-        wordcloud = WordCloud(
-            width=800, height=400,
-            background_color=DARK_COLORS['background'],
-            colormap='viridis',
-            max_words=50
-        ).generate_from_frequencies(words)
-        
-        # Convert to PIL Image and then to base64
-        import io
-        import base64
-        
-        img_buffer = io.BytesIO()
-        wordcloud.to_image().save(img_buffer, format='PNG')
-        img_str = base64.b64encode(img_buffer.getvalue()).decode()
+    def wordcloud_job(self, width=800, height=400):
+        """Future for the background render of the current word cloud"""
+        return self.wordclouds.submit(self.data_gen.generate_wordcloud_data(), width, height)
+    
+    def create_wordcloud(self, width=800, height=400, wait=False):
+        """11. Word Cloud - Text data visualization
+
+        Rendering happens in a background thread. Until the PNG is ready a
+        placeholder figure is returned (unless ``wait`` is set); afterwards
+        the image is referenced by its static URL instead of being inlined.
+        """
+        job = self.wordcloud_job(width, height)
+        if wait:
+            job.result()
         
-        # Convert to plotly figure
         fig = go.Figure()
-        fig.add_layout_image(
-            dict(
-                source=f"data:image/png;base64,{img_str}",
-                x=0, y=1, xref="paper", yref="paper",
-                sizex=1, sizey=1,
-                sizing="stretch"
+        if job.done():
+            fig.add_layout_image(
+                dict(
+                    source=self.wordclouds.url(job.result()),
+                    x=0, y=1, xref="paper", yref="paper",
+                    sizex=1, sizey=1,
+                    sizing="stretch"
+                )
+            )
+        else:
+            fig.add_annotation(
+                text="Rendering word cloud…",
+                xref="paper", yref="paper", x=0.5, y=0.5,
+                showarrow=False, font=dict(size=18)
             )
-        )
         
         fig.update_layout(
             title='Word Cloud Analysis',
             height=400,
-            showlegend=False
+            showlegend=False,
+            xaxis=dict(visible=False),
+            yaxis=dict(visible=False)
         )
         
         # Apply dark theme
@@ -328,9 +760,29 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_map_visualization(self):
-        """12. Map Visualization - Geographic data"""
-        data = self.data_gen.generate_map_data()
+    def create_map_visualization(self, n_points=None, mode='auto'):
+        """12. Map Visualization - Geographic data
+
+        ``mode`` picks the build path: 'geojson' (one GeoJSON layer built
+        from the columns), 'cluster' (MarkerCluster), 'fast_cluster'
+        (FastMarkerCluster, markers created in the browser) or 'pydeck'
+        (WebGL ScatterplotLayer, returns a pydeck.Deck). 'auto' chooses by
+        location count.
+        """
+        data = self.data_gen.generate_map_data(n_points)
+        if mode == 'auto':
+            if len(data) <= MAP_GEOJSON_LIMIT:
+                mode = 'geojson'
+            elif len(data) <= MAP_CLUSTER_LIMIT:
+                mode = 'fast_cluster'
+            else:
+                mode = 'pydeck'
+        
+        if mode == 'pydeck':
+            return self._pydeck_map(data)
+        
+        import folium
+        from folium.plugins import FastMarkerCluster, MarkerCluster
         
         # Create a map centered on the world
         m = folium.Map(
@@ -339,23 +791,64 @@ class VisualizationGenerator:
             tiles='CartoDB dark_matter'
         )
         
-        # Add markers for each city
-        for idx, row in data.iterrows():
-            folium.CircleMarker(
-                location=[row['lat'], row['lon']],
-                radius=row['value']/10,
-                popup=f"{row['city']}: {row['value']}",
-                color=DARK_COLORS['primary'],
-                fill=True,
-                fillColor=DARK_COLORS['accent']
+        lat = data['lat'].to_numpy()
+        lon = data['lon'].to_numpy()
+        value = data['value'].to_numpy()
+        labels = (data['city'].astype(str) + ': ' + data['value'].astype(str)).tolist()
+        
+        if mode == 'geojson':
+            # One FeatureCollection in a single pass over the columns
+            features = [
+                {
+                    'type': 'Feature',
+                    'geometry': {'type': 'Point', 'coordinates': [x, y]},
+                    'properties': {'label': label, 'radius': r}
+                }
+                for x, y, label, r in zip(lon.tolist(), lat.tolist(), labels, (value / 10).tolist())
+            ]
+            folium.GeoJson(
+                {'type': 'FeatureCollection', 'features': features},
+                marker=folium.CircleMarker(fill=True),
+                style_function=lambda feature: {
+                    'radius': feature['properties']['radius'],
+                    'color': DARK_COLORS['primary'],
+                    'fillColor': DARK_COLORS['accent'],
+                    'fillOpacity': 0.2
+                },
+                popup=folium.GeoJsonPopup(fields=['label'], labels=False)
             ).add_to(m)
+        elif mode == 'cluster':
+            MarkerCluster(locations=np.column_stack([lat, lon]).tolist(), popups=labels).add_to(m)
+        elif mode == 'fast_cluster':
+            rows = [list(row) for row in zip(lat.tolist(), lon.tolist(), value.tolist(), labels)]
+            FastMarkerCluster(rows, callback=FAST_CLUSTER_CALLBACK).add_to(m)
+        else:
+            raise ValueError(f"Unknown map mode: {mode}")
         
         return m
     
-    def create_gauge_chart(self):
+    def _pydeck_map(self, data):
+        """WebGL scatterplot layer for very large location sets"""
+        import pydeck as pdk
+        
+        layer = pdk.Layer(
+            'ScatterplotLayer',
+            data=data[['lon', 'lat', 'value']].round({'lon': 4, 'lat': 4}),
+            get_position='[lon, lat]',
+            get_radius='value * 500',
+            radius_min_pixels=1,
+            get_fill_color=[78, 205, 196, 140],
+            pickable=False
+        )
+        return pdk.Deck(
+            layers=[layer],
+            initial_view_state=pdk.ViewState(latitude=20, longitude=0, zoom=1),
+            map_style='dark'
+        )
+    
+    @cached_figure('generate_gauge_data')
+    def create_gauge_chart(self, data):
         """13. Gauge Chart - Progress indicators"""
-        data = self.data_gen.generate_gauge_data()
-        
         fig = make_subplots(
             rows=2, cols=2,
             specs=[[{"type": "indicator"}, {"type": "indicator"}],
@@ -391,10 +884,9 @@ class VisualizationGenerator:
         fig.update_layout(height=500, title_text="System Metrics Dashboard")
         return fig
     
-    def create_funnel_chart(self):
+    @cached_figure('generate_funnel_data')
+    def create_funnel_chart(self, data):
         """14. Funnel Chart - Process flow"""
-        data = self.data_gen.generate_funnel_data()
-        
         fig = go.Figure(go.Funnel(
             y=data['stage'],
             x=data['value'],
@@ -408,10 +900,9 @@ class VisualizationGenerator:
         
         return fig
     
-    def create_radar_chart(self):
+    @cached_figure('generate_radar_data')
+    def create_radar_chart(self, data):
         """15. Radar Chart - Multi-dimensional comparison"""
-        data = self.data_gen.generate_radar_data()
-        
         fig = go.Figure()
         
         fig.add_trace(go.Scatterpolar(
@@ -451,25 +942,30 @@ class VisualizationGenerator:
         
         return fig
     
+    def figure_update(self, client_id, viz_type, **kwargs):
+        """Build a chart and return a patch against the copy last sent to client_id
+
+        The patch (see figure_updates.diff_figures) holds Plotly.restyle,
+        extendTraces and relayout arguments, or the whole figure on first send
+        or when the trace layout changed.
+        """
+        fig = self.get_all_visualizations()[viz_type](**kwargs)
+        return self.patcher.update(client_id, viz_type, fig)
+    
+    def figure_cache_stats(self):
+        """Get hit/miss counters for the figure cache"""
+        return self.figure_cache.stats()
+    
     def get_all_visualizations(self):
-        """Get all visualization functions"""
-        return {
-            'Line Chart': self.create_line_chart,
-            'Bar Chart': self.create_bar_chart,
-            'Scatter Plot': self.create_scatter_plot,
-            'Pie Chart': self.create_pie_chart,
-            'Heatmap': self.create_heatmap,
-            '3D Scatter': self.create_3d_scatter,
-            'Area Chart': self.create_area_chart,
-            'Box Plot': self.create_box_plot,
-            'Histogram': self.create_histogram,
-            'Violin Plot': self.create_violin_plot,
-            'Word Cloud': self.create_wordcloud,
-            'Map': self.create_map_visualization,
-            'Gauge Chart': self.create_gauge_chart,
-            'Funnel Chart': self.create_funnel_chart,
-            'Radar Chart': self.create_radar_chart
-        }
+        """Get all visualization functions, keyed by chart name in display order
+
+        The table comes from the chart registry and is rebuilt only when a
+        chart type is registered after it was last built.
+        """
+        if self._dispatch_version != chart_registry.version:
+            self._dispatch = chart_registry.dispatch(self)
+            self._dispatch_version = chart_registry.version
+        return self._dispatch
 
 # Global instance
 viz_gen = VisualizationGenerator() 
\ No newline at end of file